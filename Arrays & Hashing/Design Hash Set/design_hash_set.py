@@ -1,3 +1,9 @@
+from array import array
+from bisect import bisect_left
+import struct
+import sys
+import time
+
 class Node:
     """
     Node class for a singly linked list used in hash set buckets.
@@ -27,14 +33,34 @@ class MyHashSet:
     - Handles collisions by chaining multiple keys in same bucket
     """
     
-    def __init__(self):
+    def __init__(self, mode="chained", capacity=16):
         """
         Initialize the hash set with an array of 10,000 dummy head nodes.
         
         Creates an array where each element is a dummy head Node(0) that 
         serves as the starting point for a linked list (bucket).
         This simplifies edge cases when adding/removing from linked lists.
+        
+        With mode="open" the set is instead backed by OpenAddressingHashSet
+        (flat array('q') slots that grow with the number of keys), and the
+        public methods are bound straight to that engine so no extra call
+        layer is paid per operation.
+        
+        Args:
+            mode (str): "chained" (default) or "open"
+            capacity (int): Initial slot count hint, only used by "open" mode
         """
+        if mode == "open":
+            engine = OpenAddressingHashSet(capacity)
+            self.engine = engine
+            self.add = engine.add
+            self.remove = engine.remove
+            self.contains = engine.contains
+            self.add_many = engine.add_many
+            self.contains_many = engine.contains_many
+            return
+        if mode != "chained":
+            raise ValueError(f"unknown MyHashSet mode: {mode!r}")
         self.tmp = [Node(0) for i in range(10000)]  # Array of dummy head nodes
         self.size = 10**4  # Fixed size of the hash table (10,000 buckets)
 
@@ -131,6 +157,556 @@ class MyHashSet:
         
         return False
 
+    def add_many(self, keys, raw=False) -> None:
+        """
+        Add every key of an iterable (list, array, memoryview, ...) to the set.
+        
+        Args:
+            keys: Any iterable of integer keys
+            raw (bool): Read a byte buffer as native signed 64-bit integers
+        """
+        for key in _as_sequence(keys, raw):
+            self.add(key)
+
+    def contains_many(self, keys, raw=False) -> list:
+        """
+        Check membership for every key of an iterable.
+        
+        Args:
+            keys: Any iterable of integer keys
+            raw (bool): Read a byte buffer as native signed 64-bit integers
+            
+        Returns:
+            list: One bool per key, in input order
+        """
+        return [self.contains(key) for key in _as_sequence(keys, raw)]
+
+
+_EMPTY, _FULL, _DELETED = 0, 1, 2  # Slot states for open addressing
+_GOLDEN = 0x9E3779B97F4A7C15        # 2^64 / golden ratio, for Fibonacci hashing
+_MASK64 = (1 << 64) - 1
+
+
+class OpenAddressingHashSet:
+    """
+    Hash set of 64-bit integers stored in flat arrays with linear probing.
+    
+    Instead of one Node object per key, keys live in an array('q') and a
+    parallel array('B') records the state of every slot (empty, full or
+    deleted). This costs 9 bytes per slot instead of ~100 bytes per key.
+    
+    Design:
+    - Capacity is always a power of two
+    - Fibonacci hashing: the top bits of key * golden_ratio pick the home slot,
+      so strided keys (multiples of 1024, ...) still spread evenly
+    - Linear probing on collisions
+    - Removed keys leave a tombstone so later probes keep walking past them
+    - When full + deleted slots exceed MAX_LOAD of the table, the table is
+      rebuilt (doubled if it is really full, same size if it is mostly
+      tombstones)
+    
+    Time Complexity: O(1) average for add, remove, contains
+    Space Complexity: O(capacity), with capacity <= n / (MAX_LOAD / 2)
+    
+    Keys must fit in a signed 64-bit integer (OverflowError otherwise).
+    """
+    MAX_LOAD = 0.7
+
+    def __init__(self, capacity=16):
+        """
+        Create an empty set with room for at least `capacity` slots.
+        
+        Args:
+            capacity (int): Initial number of slots (rounded up to a power of two)
+        """
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """
+        Replace the slot arrays with empty ones of at least `capacity` slots.
+        """
+        bits = max(3, (max(capacity, 1) - 1).bit_length())
+        self.capacity = 1 << bits
+        self.shift = 64 - bits           # Top `bits` bits of the hash pick the slot
+        self.mask = self.capacity - 1
+        self.keys = array('q', bytes(8 * self.capacity))
+        self.state = array('B', bytes(self.capacity))
+        self.count = 0                   # Live keys
+        self.used = 0                    # Live keys + tombstones
+        self.limit = int(self.capacity * self.MAX_LOAD)
+
+    def __len__(self):
+        return self.count
+
+    def _resize(self, needed):
+        """
+        Rebuild the table so that `needed` live keys fit under the load limit.
+        
+        Tombstones are dropped in the process.
+        """
+        old_keys, old_state = self.keys, self.state
+        capacity = self.capacity
+        while needed > capacity * self.MAX_LOAD / 2:
+            capacity *= 2
+        self._allocate(capacity)
+        self._insert_all(k for k, st in zip(old_keys, old_state) if st == _FULL)
+
+    def _insert_all(self, keys):
+        """
+        Insert keys assuming the table already has room for all of them.
+        
+        This is the hot loop of add_many and _resize, so attribute lookups are
+        hoisted into locals.
+        """
+        slots, state = self.keys, self.state
+        shift, mask = self.shift, self.mask
+        added = 0
+        for key in keys:
+            i = ((key * _GOLDEN) & _MASK64) >> shift
+            free = -1
+            while True:
+                st = state[i]
+                if st == _EMPTY:
+                    if free < 0:
+                        free = i
+                        self.used += 1
+                    slots[free] = key
+                    state[free] = _FULL
+                    added += 1
+                    break
+                if st == _FULL:
+                    if slots[i] == key:
+                        break  # Already present
+                elif free < 0:
+                    free = i   # Remember first tombstone, reuse it if key is absent
+                i = (i + 1) & mask
+        self.count += added
+
+    def add(self, key: int) -> None:
+        """
+        Add a key to the set if it is not already present.
+        
+        Args:
+            key (int): Signed 64-bit integer key
+        """
+        if self.used + 1 > self.limit:
+            self._resize(self.count + 1)
+        self._insert_all((key,))
+
+    def remove(self, key: int) -> None:
+        """
+        Remove a key from the set if it exists, leaving a tombstone behind.
+        
+        Args:
+            key (int): Signed 64-bit integer key
+        """
+        i = self._find(key)
+        if i >= 0:
+            self.state[i] = _DELETED
+            self.count -= 1
+
+    def _find(self, key):
+        """
+        Return the slot holding `key`, or -1 if it is not in the set.
+        """
+        slots, state, mask = self.keys, self.state, self.mask
+        i = ((key * _GOLDEN) & _MASK64) >> self.shift
+        while True:
+            st = state[i]
+            if st == _EMPTY:
+                return -1
+            if st == _FULL and slots[i] == key:
+                return i
+            i = (i + 1) & mask
+
+    def contains(self, key: int) -> bool:
+        """
+        Check if a key exists in the set.
+        
+        Args:
+            key (int): Signed 64-bit integer key
+            
+        Returns:
+            bool: True if key exists in the set, False otherwise
+        """
+        return self._find(key) >= 0
+
+    def add_many(self, keys, raw=False) -> None:
+        """
+        Add many keys at once.
+        
+        The table is grown a single time up front, then keys are inserted in
+        one tight loop. Any buffer-protocol object (array, bytes, NumPy
+        array, memoryview, ...) or plain iterable is accepted; buffers are
+        read through a memoryview in their own format, so they are never
+        copied.
+        
+        Args:
+            keys: Buffer or iterable of signed 64-bit integer keys
+            raw (bool): Read a byte buffer (e.g. the bytes of a NumPy int64
+                array) as native signed 64-bit integers
+        """
+        keys = _as_sequence(keys, raw)
+        if self.used + len(keys) > self.limit:
+            self._resize(self.count + len(keys))
+        self._insert_all(keys)
+
+    def contains_many(self, keys, raw=False) -> list:
+        """
+        Check membership for many keys at once.
+        
+        Args:
+            keys: Buffer or iterable of signed 64-bit integer keys
+            raw (bool): Read a byte buffer as native signed 64-bit integers
+            
+        Returns:
+            list: One bool per key, in input order
+        """
+        slots, state = self.keys, self.state
+        shift, mask = self.shift, self.mask
+        res = []
+        for key in _as_sequence(keys, raw):
+            i = ((key * _GOLDEN) & _MASK64) >> shift
+            found = False
+            while True:
+                st = state[i]
+                if st == _EMPTY:
+                    break
+                if st == _FULL and slots[i] == key:
+                    found = True
+                    break
+                i = (i + 1) & mask
+            res.append(found)
+        return res
+
+
+def _as_sequence(keys, raw=False):
+    """
+    Return `keys` as something with a length that iterates as Python ints.
+    
+    Buffer-protocol objects become a memoryview (zero-copy) that iterates in
+    the buffer's own format, so array('B') or bytes yield one key per byte.
+    Only with raw=True are the bytes reinterpreted as native signed 64-bit
+    integers.
+    
+    Raises:
+        ValueError: If raw is set and the buffer is not a multiple of 8 bytes
+    """
+    try:
+        view = memoryview(keys)
+    except TypeError:
+        if raw:
+            raise
+        return keys if hasattr(keys, '__len__') else list(keys)
+    if raw:
+        if view.nbytes % 8:
+            raise ValueError("raw key buffers must hold whole 8-byte integers")
+        return view.cast('B').cast('q')
+    if view.format == 'c':  # Iterate single chars as their byte values
+        view = view.cast('B')
+    return view
+
+
+_ARRAY_MAX = 4096      # Above this many values a chunk is cheaper as a bitmap
+_CHUNK_BYTES = 8192    # 2^16 bits per chunk
+_BYTE_BITS = tuple(tuple(b for b in range(8) if v >> b & 1) for v in range(256))
+
+
+class _ArrayContainer:
+    """
+    Sparse chunk: the low 16 bits of every key, kept sorted in an array('H').
+    
+    2 bytes per key, binary search for lookups.
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else array('H')
+
+    def __len__(self):
+        return len(self.values)
+
+    def contains(self, low):
+        values = self.values
+        i = bisect_left(values, low)
+        return i < len(values) and values[i] == low
+
+    def add(self, low):
+        """Insert `low`; returns True if it was not present."""
+        values = self.values
+        i = bisect_left(values, low)
+        if i < len(values) and values[i] == low:
+            return False
+        values.insert(i, low)
+        return True
+
+    def remove(self, low):
+        """Delete `low`; returns True if it was present."""
+        values = self.values
+        i = bisect_left(values, low)
+        if i < len(values) and values[i] == low:
+            del values[i]
+            return True
+        return False
+
+    def lows(self):
+        return self.values
+
+    def as_int(self):
+        bits = bytearray(_CHUNK_BYTES)
+        for low in self.values:
+            bits[low >> 3] |= 1 << (low & 7)
+        return int.from_bytes(bits, 'little')
+
+
+class _BitmapContainer:
+    """
+    Dense chunk: one bit per possible low 16-bit value (8 KB per chunk).
+    
+    Set operations between bitmaps run on whole Python ints, which CPython
+    evaluates word by word in C.
+    """
+    __slots__ = ('bits', 'card')
+
+    def __init__(self, bits=None, card=0):
+        self.bits = bits if bits is not None else bytearray(_CHUNK_BYTES)
+        self.card = card
+
+    def __len__(self):
+        return self.card
+
+    def contains(self, low):
+        return self.bits[low >> 3] >> (low & 7) & 1 == 1
+
+    def add(self, low):
+        byte, bit = low >> 3, 1 << (low & 7)
+        if self.bits[byte] & bit:
+            return False
+        self.bits[byte] |= bit
+        self.card += 1
+        return True
+
+    def remove(self, low):
+        byte, bit = low >> 3, 1 << (low & 7)
+        if not self.bits[byte] & bit:
+            return False
+        self.bits[byte] &= ~bit & 0xFF
+        self.card -= 1
+        return True
+
+    def lows(self):
+        res = array('H')
+        for i, v in enumerate(self.bits):
+            if v:
+                base = i << 3
+                res.extend(base + b for b in _BYTE_BITS[v])
+        return res
+
+    def as_int(self):
+        return int.from_bytes(self.bits, 'little')
+
+
+def _container_from_int(x):
+    """
+    Build the cheapest container for a chunk given as a 2^16-bit integer.
+    
+    Returns None for an empty chunk.
+    """
+    card = x.bit_count()
+    if card == 0:
+        return None
+    bitmap = _BitmapContainer(bytearray(x.to_bytes(_CHUNK_BYTES, 'little')), card)
+    if card > _ARRAY_MAX:
+        return bitmap
+    return _ArrayContainer(bitmap.lows())
+
+
+class RoaringHashSet:
+    """
+    Compressed integer set with the same add/remove/contains API as MyHashSet.
+    
+    Roaring-bitmap layout: a key is split into its high bits (chunk id,
+    key >> 16) and its low 16 bits. Each chunk holds its low halves in
+    - an array container (sorted array('H'), 2 bytes/key) while it has at
+      most 4096 keys, or
+    - a bitmap container (8 KB, 1 bit per possible key) once it is denser.
+    
+    Dense ID ranges therefore cost ~1 bit per key instead of a ~100 byte
+    Node, and union / intersection / difference work chunk by chunk, using
+    whole-bitmap integer operations where at least one side is dense.
+    
+    Time Complexity:
+    - add/remove: O(log 4096) for array chunks (plus a shift of at most
+      4096 values), O(1) for bitmap chunks
+    - contains: O(log 4096) or O(1)
+    - set operations: O(number of chunks * 8 KB) worst case
+    Space Complexity: ~min(2 bytes/key, 8 KB/chunk)
+    """
+
+    def __init__(self, keys=()):
+        self.chunks = {}  # high bits -> container
+        self.count = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return self.count
+
+    def cardinality(self) -> int:
+        """
+        Number of keys in the set.
+        """
+        return self.count
+
+    def add(self, key: int) -> None:
+        """
+        Add a key to the set if it doesn't already exist.
+        
+        An array chunk that grows past 4096 keys is converted to a bitmap.
+        """
+        high, low = key >> 16, key & 0xFFFF
+        chunk = self.chunks.get(high)
+        if chunk is None:
+            chunk = self.chunks[high] = _ArrayContainer()
+        if chunk.add(low):
+            self.count += 1
+            if type(chunk) is _ArrayContainer and len(chunk) > _ARRAY_MAX:
+                self.chunks[high] = _BitmapContainer(
+                    bytearray(chunk.as_int().to_bytes(_CHUNK_BYTES, 'little')), len(chunk))
+
+    def remove(self, key: int) -> None:
+        """
+        Remove a key from the set if it exists.
+        
+        A bitmap chunk that shrinks to 4096 keys is converted back to an array.
+        """
+        high = key >> 16
+        chunk = self.chunks.get(high)
+        if chunk is None or not chunk.remove(key & 0xFFFF):
+            return
+        self.count -= 1
+        if not len(chunk):
+            del self.chunks[high]
+        elif type(chunk) is _BitmapContainer and len(chunk) <= _ARRAY_MAX:
+            self.chunks[high] = _ArrayContainer(chunk.lows())
+
+    def contains(self, key: int) -> bool:
+        """
+        Check if a key exists in the set.
+        """
+        chunk = self.chunks.get(key >> 16)
+        return chunk is not None and chunk.contains(key & 0xFFFF)
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def __iter__(self):
+        """
+        Yield the keys in increasing order.
+        """
+        for high in sorted(self.chunks):
+            base = high << 16
+            for low in self.chunks[high].lows():
+                yield base + low
+
+    def _combine(self, other, op, keep_left, keep_right):
+        """
+        Apply a bitwise `op` chunk by chunk.
+        
+        keep_left / keep_right say whether a chunk present on only one side
+        survives unchanged (True for union, left-only for difference).
+        """
+        res = RoaringHashSet()
+        for high in self.chunks.keys() | other.chunks.keys():
+            a, b = self.chunks.get(high), other.chunks.get(high)
+            if a is None or b is None:
+                only = a if b is None else b
+                if (keep_left if b is None else keep_right):
+                    chunk = _container_from_int(only.as_int())
+                else:
+                    chunk = None
+            elif op is int.__and__ and _ArrayContainer in (type(a), type(b)):
+                # Sparse side drives the intersection: probe its values only
+                small, big = (a, b) if type(a) is _ArrayContainer else (b, a)
+                values = array('H', (v for v in small.values if big.contains(v)))
+                chunk = _ArrayContainer(values) if values else None
+            else:
+                chunk = _container_from_int(op(a.as_int(), b.as_int()))
+            if chunk is not None:
+                res.chunks[high] = chunk
+                res.count += len(chunk)
+        return res
+
+    def union(self, other):
+        """Return a new set with the keys of both sets."""
+        return self._combine(other, int.__or__, True, True)
+
+    def intersection(self, other):
+        """Return a new set with the keys present in both sets."""
+        return self._combine(other, int.__and__, False, False)
+
+    def difference(self, other):
+        """Return a new set with the keys of self that are not in other."""
+        return self._combine(other, lambda x, y: x & ~y, True, False)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the set into a compact, portable byte string.
+        
+        Layout (little endian): b'RHS1', chunk count (u32), then for each chunk
+        in increasing order: high bits (i64), kind (u8, 0 = array,
+        1 = bitmap), cardinality (u32), and the payload (u16 per key for
+        array chunks, 8 KB of bits for bitmap chunks).
+        """
+        parts = [b'RHS1', struct.pack('<I', len(self.chunks))]
+        for high in sorted(self.chunks):
+            chunk = self.chunks[high]
+            if type(chunk) is _ArrayContainer:
+                values = array('H', chunk.values)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                parts.append(struct.pack('<qBI', high, 0, len(chunk)))
+                parts.append(values.tobytes())
+            else:
+                parts.append(struct.pack('<qBI', high, 1, len(chunk)))
+                parts.append(bytes(chunk.bits))
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Rebuild a set serialized by to_bytes.
+        
+        Raises:
+            ValueError: If the data is not a valid RoaringHashSet snapshot
+        """
+        view = memoryview(data)
+        if bytes(view[:4]) != b'RHS1':
+            raise ValueError("not a RoaringHashSet snapshot")
+        (n,) = struct.unpack_from('<I', view, 4)
+        pos = 8
+        res = cls()
+        for _ in range(n):
+            high, kind, card = struct.unpack_from('<qBI', view, pos)
+            pos += struct.calcsize('<qBI')
+            if kind == 0:
+                values = array('H', view[pos:pos + 2 * card].tobytes())
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                pos += 2 * card
+                res.chunks[high] = _ArrayContainer(values)
+            elif kind == 1:
+                res.chunks[high] = _BitmapContainer(bytearray(view[pos:pos + _CHUNK_BYTES]), card)
+                pos += _CHUNK_BYTES
+            else:
+                raise ValueError(f"unknown container kind {kind}")
+            res.count += card
+        return res
+
 # Your MyHashSet object will be instantiated and called as such:
 # obj = MyHashSet()
 # obj.add(key)
@@ -178,5 +754,36 @@ def main():
     # 4. Removal worked correctly
     # 5. Post-removal containment check was correct
 
+def benchmark(sizes=(10**4, 10**6, 10**7)):
+    """
+    Compare the chained and open-addressing modes for n random keys.
+    
+    For each size, times add_many of n keys followed by contains_many of
+    n probes (half hits, half misses). The chained table has a fixed 10,000
+    buckets, so its build is quadratic once n >> 10^4; it is skipped above
+    10^6 keys where it would take hours.
+    
+    Run with: python design_hash_set.py --bench
+    """
+    import random
+    for n in sizes:
+        keys = array('q', random.sample(range(4 * n), n))
+        probes = array('q', keys[: n // 2]) + array('q', range(4 * n, 4 * n + n - n // 2))
+        for mode in ("chained", "open"):
+            if mode == "chained" and n > 10**6:
+                print(f"n={n:>10,} {mode:>8}: skipped (chains of ~{n // 10**4:,} nodes)")
+                continue
+            obj = MyHashSet(mode)
+            start = time.perf_counter()
+            obj.add_many(keys)
+            built = time.perf_counter()
+            hits = sum(obj.contains_many(probes))
+            done = time.perf_counter()
+            print(f"n={n:>10,} {mode:>8}: add {built - start:8.2f}s  "
+                  f"contains {done - built:8.2f}s  hits={hits:,}")
+
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -1,3 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+
 class Node:
     """
     Node class for a singly linked list used in hash map buckets.
@@ -143,6 +153,236 @@ class MyHashMap:
             curr.next = curr.next.next
             # The removed node will be garbage collected
 
+    def items(self):
+        """
+        Yield every stored (key, value) pair, bucket by bucket.
+        
+        The dummy head of bucket 0 doubles as the slot for key 0 (see put),
+        so it is reported once it has been written.
+        """
+        for head in self.hash:
+            if head.key == 0 and head.value != -1 and head is self.hash[0]:
+                yield head.key, head.value
+            curr = head.next
+            while curr:
+                yield curr.key, curr.value
+                curr = curr.next
+
+    def save(self, path) -> None:
+        """
+        Write the map to `path` in the snapshot format read by open_mmap.
+        
+        The file is written to a temporary file in the same directory and
+        renamed over `path`, so readers see either the old or the new
+        snapshot, never a partial one.
+        
+        Args:
+            path (str): Destination file
+        """
+        data = _build_snapshot(list(self.items()))
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @staticmethod
+    def open_mmap(path):
+        """
+        Open a snapshot written by save() without loading it into memory.
+        
+        Args:
+            path (str): Snapshot file
+            
+        Returns:
+            MappedHashMap: Read-only map answering get() from the mapped file
+        """
+        return MappedHashMap(path)
+
+
+# Snapshot layout (all little endian):
+#   header: magic b'MHM1', slot count (u64, power of two), entry count (u64)
+#   slots:  slot count * (key i64, value i64), open addressing with linear
+#           probing from the Fibonacci hash of the key; key == _EMPTY_KEY
+#           marks an empty slot.
+_HEADER = struct.Struct('<4sQQ')
+_SLOT = struct.Struct('<qq')
+_EMPTY_KEY = -(1 << 63)
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def _build_snapshot(entries):
+    """
+    Lay out (key, value) pairs in the snapshot format, at most half full.
+    """
+    bits = max(3, (2 * len(entries) - 1).bit_length())
+    capacity, shift, mask = 1 << bits, 64 - bits, (1 << bits) - 1
+    data = bytearray(_HEADER.pack(b'MHM1', capacity, len(entries)))
+    data += _SLOT.pack(_EMPTY_KEY, 0) * capacity
+    used = bytearray(capacity)
+    base = _HEADER.size
+    for key, value in entries:
+        if key == _EMPTY_KEY:
+            raise ValueError(f"key {key} is reserved by the snapshot format")
+        i = ((key * _GOLDEN) & _MASK64) >> shift
+        while used[i]:
+            i = (i + 1) & mask
+        used[i] = 1
+        _SLOT.pack_into(data, base + i * _SLOT.size, key, value)
+    return data
+
+
+class MappedHashMap:
+    """
+    Read-only MyHashMap view over a memory-mapped snapshot file.
+    
+    Opening costs one mmap call regardless of the number of entries: nothing
+    is parsed until get() touches the slots it probes. The mapping is
+    read-only and backed by the OS page cache, so any number of worker
+    processes opening the same file share a single copy in memory.
+    
+    Time Complexity: O(1) average per get (the table is at most half full)
+    Space Complexity: O(1) resident, pages are loaded on demand
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.capacity, self.count = _HEADER.unpack_from(self.mm, 0)
+        if magic != b'MHM1':
+            self.mm.close()
+            raise ValueError(f"{path} is not a MyHashMap snapshot")
+        self.shift = 64 - (self.capacity.bit_length() - 1)
+        self.mask = self.capacity - 1
+
+    def __len__(self):
+        return self.count
+
+    def get(self, key: int) -> int:
+        """
+        Retrieve the value for key, or -1 if it is not in the snapshot.
+        """
+        mm, mask, unpack = self.mm, self.mask, _SLOT.unpack_from
+        i = ((key * _GOLDEN) & _MASK64) >> self.shift
+        while True:
+            k, v = unpack(mm, _HEADER.size + i * _SLOT.size)
+            if k == _EMPTY_KEY:  # Checked first: the sentinel is never a stored key
+                return -1
+            if k == key:
+                return v
+            i = (i + 1) & mask
+
+    def close(self):
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConcurrentHashMap(MyHashMap):
+    """
+    Thread-safe MyHashMap using lock striping.
+    
+    The 10,000 buckets are guarded by a smaller set of locks: bucket b is
+    protected by lock b % stripes. Writers that land in different stripes
+    never wait for each other, unlike wrapping every call in one global lock.
+    
+    Reads take no lock at all. Under CPython every change a writer makes to
+    a chain is a single reference store (node.value = v, curr.next = node or
+    curr.next = curr.next.next), which the GIL makes atomic, so a reader
+    walking the chain always sees either the old or the new chain, never a
+    broken one.
+    
+    Time Complexity: same as MyHashMap, plus one uncontended lock per write
+    Space Complexity: O(capacity + number of keys + stripes)
+    """
+
+    def __init__(self, stripes=64):
+        """
+        Args:
+            stripes (int): Number of locks shared by the buckets
+        """
+        super().__init__()
+        self.stripes = stripes
+        self.locks = [threading.Lock() for _ in range(stripes)]
+
+    def _lock_for(self, key):
+        return self.locks[(key % self.size) % self.stripes]
+
+    def put(self, key: int, value: int) -> None:
+        """
+        Insert or update a key-value pair while holding the key's stripe lock.
+        """
+        with self._lock_for(key):
+            super().put(key, value)
+
+    def remove(self, key: int) -> None:
+        """
+        Remove a key while holding the key's stripe lock.
+        """
+        with self._lock_for(key):
+            super().remove(key)
+
+    # get() is inherited unchanged: it is lock-free (see class docstring)
+
+    def compute_if_absent(self, key: int, func) -> int:
+        """
+        Return the value for key, computing and storing func(key) if missing.
+        
+        The check and the insert happen under the same stripe lock, so func
+        runs at most once per key even when many threads race on it. Other
+        stripes stay available while func runs.
+        
+        Args:
+            key (int): The key to look up
+            func (callable): Called as func(key) to produce a missing value
+            
+        Returns:
+            int: The existing or newly computed value
+        """
+        index = key % self.size
+        with self._lock_for(key):
+            curr = self.hash[index]
+            while curr:
+                if curr.key == key and (curr.value != -1 or curr is not self.hash[index]):
+                    return curr.value  # Key found (the dummy head only counts once written)
+                curr = curr.next
+            value = func(key)
+            super().put(key, value)
+            return value
+
+
+class _GlobalLockHashMap(MyHashMap):
+    """
+    MyHashMap behind a single lock: the baseline ConcurrentHashMap replaces.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def put(self, key, value):
+        with self.lock:
+            super().put(key, value)
+
+    def get(self, key):
+        with self.lock:
+            return super().get(key)
+
+    def remove(self, key):
+        with self.lock:
+            super().remove(key)
+
 
 # Your MyHashMap object will be instantiated and called as such:
 # obj = MyHashMap()
@@ -183,5 +423,37 @@ def main():
     obj.remove(2)      # Delete key 2
     print(obj.get(2))  # Expected: -1 (key removed)
 
+def benchmark(threads=(1, 4, 16), ops=200_000):
+    """
+    Throughput of ConcurrentHashMap vs. a global-lock MyHashMap wrapper.
+    
+    Each run splits `ops` operations (80% get, 20% put over 10^5 keys)
+    across a thread pool and reports operations per second.
+    
+    Run with: python design_hashmap.py --bench
+    """
+    rng = random.Random(0)
+    work = [(rng.random() < 0.2, rng.randrange(10**5)) for _ in range(ops)]
+
+    def run(obj, chunk):
+        for is_put, key in chunk:
+            if is_put:
+                obj.put(key, key)
+            else:
+                obj.get(key)
+
+    for n in threads:
+        for cls in (_GlobalLockHashMap, ConcurrentHashMap):
+            obj = cls()
+            chunks = [work[i::n] for i in range(n)]
+            start = time.perf_counter()
+            with ThreadPoolExecutor(n) as pool:
+                list(pool.map(run, [obj] * n, chunks))
+            elapsed = time.perf_counter() - start
+            print(f"{n:>2} threads {cls.__name__:>18}: {ops / elapsed:12,.0f} ops/s")
+
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
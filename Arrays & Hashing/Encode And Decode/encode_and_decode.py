@@ -1,55 +1,349 @@
+"""
+Encode and Decode Strings
+-------------------------
+Encode a list of strings into a single payload and decode it back.
+
+Framing:
+--------
+Every string is written as its UTF-8 length as an unsigned LEB128 varint
+(7 bits per byte, high bit set on all but the last byte) followed by its
+UTF-8 bytes. Because the decoder always knows exactly how many bytes belong
+to the next string, any character (including ';' or '\\0') round-trips, and
+short strings pay only one byte of overhead.
+
+The streaming functions work on file objects in fixed-size chunks, so a
+payload never has to fit in memory, and decode() hands out memoryview
+slices of the input instead of copying every string.
+
+For random access, StringColumn stores the same strings Arrow-style: one
+contiguous UTF-8 data buffer plus an offsets buffer, so string i is found
+in O(1) without decoding anything before it.
+"""
+from array import array
+import mmap
+import struct
+import sys
+
+_CHUNK = 1 << 20  # Bytes per read/write in the streaming functions
+_SMALL = [bytes((n,)) for n in range(0x80)]  # Prefixes of strings shorter than 128 bytes
+
+
+def _varint(n):
+    """
+    Encode a non-negative integer as an unsigned LEB128 varint.
+    """
+    if n < 0x80:
+        return _SMALL[n]
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _read_varint(view, pos):
+    """
+    Read a varint from `view` starting at `pos`.
+
+    Returns:
+        tuple: (value, position after the varint), or (None, pos) if the
+        buffer ends in the middle of the varint
+    """
+    n = shift = 0
+    end = len(view)
+    while pos < end:
+        byte = view[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+    return None, pos
+
+
+def _frames(strs):
+    """
+    Yield prefix, body, prefix, body, ... for every string in `strs`.
+    """
+    for s in strs:
+        data = s.encode('utf-8') if isinstance(s, str) else s
+        yield _varint(len(data))
+        yield data
+
+
 def encode(strs):
     """
-    Encodes a list of strings into a single string using semicolon delimiter.
-    
-    This function attempts to join strings with a semicolon separator.
-    
+    Encodes a list of strings into a single length-prefixed payload.
+
     Args:
-        strs (list): List of strings to encode
-        
+        strs (iterable): Strings (or bytes) to encode
+
     Returns:
-        str or None: Encoded string, or None for empty list
-        
-    BUG: Returns None for empty list instead of empty string
+        bytes: Encoded payload (b'' for an empty list)
+
+    Time Complexity: O(total length), one join at the end
+    """
+    return b''.join(_frames(strs))
+
+
+def decode(data):
+    """
+    Decodes a payload produced by encode() without copying the strings.
+
+    Yields one memoryview slice of `data` per string. Use str(view, 'utf-8')
+    to turn a slice into a string, or bytes(view) to keep a copy after the
+    underlying buffer goes away.
+
+    Args:
+        data (bytes-like): Encoded payload (bytes, bytearray, mmap, ...)
+
+    Yields:
+        memoryview: The UTF-8 bytes of each string, in order
+
+    Raises:
+        ValueError: If the payload is truncated
     """
-    # If list is not empty, join with semicolons
-    # If list is empty, return None (this is the bug)
-    return ';'.join(strs) if len(strs) > 0 else None
+    view = memoryview(data).cast('B')
+    pos, end = 0, len(view)
+    while pos < end:
+        byte = view[pos]
+        if byte < 0x80:  # Fast path: strings shorter than 128 bytes
+            n, pos = byte, pos + 1
+        else:
+            n, pos = _read_varint(view, pos)
+        if n is None or pos + n > end:
+            raise ValueError("truncated payload")
+        yield view[pos:pos + n]
+        pos += n
 
-def decode(s):
+
+def encode_stream(strs, f, chunk_size=_CHUNK):
     """
-    Decodes a semicolon-delimited string back into a list of strings.
-    
+    Encode strings from any iterable (e.g. a generator) straight into a file.
+
+    Frames are collected into roughly chunk_size-byte blocks before each
+    write, so memory stays bounded by one block no matter how many strings
+    are encoded.
+
     Args:
-        s (str or None): Encoded string to decode
-        
+        strs (iterable): Strings (or bytes) to encode, consumed lazily
+        f: Binary file object opened for writing
+        chunk_size (int): Target size of each write
+
     Returns:
-        list: Decoded list of strings
+        int: Number of bytes written
     """
-    # Handle None input (from encode with empty list)
-    if s is None:
-        return []
-    
-    # Split on semicolon to get original strings
-    tmp = s.split(';')
-    return tmp
+    parts, size, total = [], 0, 0
+    for part in _frames(strs):
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            f.write(b''.join(parts))
+            total += size
+            parts, size = [], 0
+    if parts:
+        f.write(b''.join(parts))
+        total += size
+    return total
+
+
+def decode_stream(f, chunk_size=_CHUNK):
+    """
+    Decode strings from a file written by encode_stream (or encode).
+
+    Reads the file in chunk_size blocks and yields strings as soon as their
+    frame is complete; only the unfinished tail of the current block is
+    kept between reads.
+
+    Args:
+        f: Binary file object opened for reading
+        chunk_size (int): Size of each read
+
+    Yields:
+        str: Decoded strings, in order
+
+    Raises:
+        ValueError: If the file ends in the middle of a frame
+    """
+    buf = bytearray()
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            break
+        buf += data
+        view = memoryview(buf)
+        pos, end = 0, len(buf)
+        while pos < end:
+            n, start = _read_varint(view, pos)
+            if n is None or start + n > end:
+                break  # Frame continues in the next chunk
+            yield str(view[start:start + n], 'utf-8')
+            pos = start + n
+        view.release()
+        del buf[:pos]
+    if buf:
+        raise ValueError("truncated payload")
+
+
+# StringColumn file layout (little endian):
+#   header:  magic b'SCOL', 4 padding bytes, string count n (u64)
+#   offsets: n + 1 u64 values, offsets[i]..offsets[i + 1] is string i
+#   data:    concatenated UTF-8 bytes of all strings
+# The 16-byte header keeps the offsets 8-byte aligned inside an mmap.
+_COLUMN_HEADER = struct.Struct('<4s4xQ')
+
+
+class StringColumn:
+    """
+    Immutable list of strings with O(1) random access.
+
+    Holds a contiguous UTF-8 data buffer and an offsets buffer (array('Q'),
+    or a memoryview of an mmap'd file), like an Arrow string column. Nothing
+    is decoded until it is read: indexing decodes one string, slicing returns
+    another StringColumn sharing the same buffers, and iteration decodes
+    strings one at a time. to_list() materializes everything on demand.
+
+    Time Complexity: O(1) + O(len(string)) per index, O(1) per slice
+    Space Complexity: O(total bytes + 8 * n), zero when opened via mmap
+    """
+
+    def __init__(self, data, offsets, start=0, stop=None, mm=None):
+        self._data = data          # bytes-like UTF-8 buffer
+        self._offsets = offsets    # n + 1 offsets into _data
+        self._start = start        # First visible string
+        self._stop = len(offsets) - 1 if stop is None else stop
+        self._mm = mm              # Backing mmap, if opened from a file
+
+    @classmethod
+    def from_strings(cls, strs):
+        """
+        Build a column from any iterable of strings.
+        """
+        data, offsets = bytearray(), array('Q', [0])
+        for s in strs:
+            data += s.encode('utf-8')
+            offsets.append(len(data))
+        return cls(bytes(data), offsets)
+
+    @classmethod
+    def from_payload(cls, payload):
+        """
+        Build a column from a payload produced by encode(), in one pass.
+        """
+        data, offsets = bytearray(), array('Q', [0])
+        for view in decode(payload):
+            data += view
+            offsets.append(len(data))
+        return cls(bytes(data), offsets)
+
+    def write(self, path):
+        """
+        Write the column to `path` in the layout read by open().
+        """
+        base = self._offsets[self._start]
+        offsets = array('Q', (o - base for o in self._offsets[self._start:self._stop + 1]))
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        with open(path, 'wb') as f:
+            f.write(_COLUMN_HEADER.pack(b'SCOL', len(self)))
+            f.write(offsets.tobytes())
+            f.write(memoryview(self._data)[base:self._offsets[self._stop]])
+
+    @classmethod
+    def open(cls, path):
+        """
+        Memory-map a file written by write(); nothing is read up front.
+
+        Raises:
+            ValueError: If the file is not a StringColumn
+        """
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n = _COLUMN_HEADER.unpack_from(mm, 0)
+        if magic != b'SCOL':
+            mm.close()
+            raise ValueError(f"{path} is not a StringColumn file")
+        view = memoryview(mm)
+        data_start = _COLUMN_HEADER.size + 8 * (n + 1)
+        offsets = view[_COLUMN_HEADER.size:data_start]
+        if sys.byteorder == 'big':
+            offsets = array('Q', offsets)
+            offsets.byteswap()
+        else:
+            offsets = offsets.cast('Q')
+        return cls(view[data_start:], offsets, mm=mm)
+
+    def close(self):
+        """
+        Unmap the backing file. Columns sliced from this one become invalid.
+        """
+        if self._mm is not None:
+            for buf in (self._offsets, self._data):
+                if isinstance(buf, memoryview):
+                    buf.release()
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            stop = max(start, stop)
+            return StringColumn(self._data, self._offsets,
+                                self._start + start, self._start + stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StringColumn index out of range")
+        i = self._start + index
+        return str(self._data[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+
+    def __iter__(self):
+        data, offsets = self._data, self._offsets
+        for i in range(self._start, self._stop):
+            yield str(data[offsets[i]:offsets[i + 1]], 'utf-8')
+
+    def to_list(self):
+        """
+        Decode every string into a list.
+        """
+        return list(self)
+
 
 def main():
     """
-    Main function to demonstrate the encoding/decoding with empty list.
-    
-    Creates an empty list, encodes it, then decodes the result.
-    """
-    # Empty input list
-    s = []
-    
-    # Encode the empty list - this returns None
-    lol = encode(s)
-    print(f"Encoded result: {lol}")  # Prints: Encoded result: None
-    
-    # Decode the result - this handles None and returns []
-    result = decode(lol)
-    print(f"Decoded result: {result}")  # Prints: Decoded result: []
+    Main function to demonstrate encoding/decoding.
+
+    Round-trips an empty list and a list whose strings contain the old ';'
+    delimiter, which the length prefixes handle without escaping.
+    """
+    import io
+
+    # Empty input list encodes to an empty payload
+    print(f"Encoded result: {encode([])!r}")  # Prints: Encoded result: b''
+    print(f"Decoded result: {[str(v, 'utf-8') for v in decode(encode([]))]}")  # Prints: []
+
+    # Strings containing ';' survive the round trip
+    strs = ["neet", "co;de", "", "love;;you"]
+    payload = encode(strs)
+    print(f"Decoded result: {[str(v, 'utf-8') for v in decode(payload)]}")
+
+    # Same data through the streaming codec
+    f = io.BytesIO()
+    encode_stream(iter(strs), f)
+    f.seek(0)
+    print(f"Streamed result: {list(decode_stream(f))}")
 
 if __name__ == '__main__':
     main()
@@ -1,3 +1,5 @@
+from array import array
+
 def firstMissingPositive(nums):
     """
     Brute-force approach to find the first missing positive integer.
@@ -58,10 +60,168 @@ def firstMissingPositive2(nums):
     # Therefore, the first missing positive is len(nums) + 1.
     return len(nums) + 1
 
+_FULL = (1 << 64) - 1
+
+class FreeSlotAllocator:
+    """
+    Slot-ID allocator that answers "first free positive integer" after every change.
+    
+    Slot x (x >= 1) is bit x - 1 of a hierarchical bitset:
+    - level 0: one bit per slot, 1 = in use, packed in 64-bit words (array('Q'))
+    - level k + 1: one bit per word of level k, 1 = that word is completely full
+    - the top level is a single word
+    The first free slot is found by walking down from the top word, taking the
+    lowest 0 bit at every level, so every operation touches one word per level.
+    Capacity doubles on demand; IDs reserved beyond the current capacity are
+    kept in a small overflow set until the bitset grows over them.
+    
+    Time Complexity: O(log_64 n) for allocate, release, reserve, first_missing
+    Space Complexity: O(n / 8) bytes for n slots
+    """
+
+    def __init__(self, capacity=64):
+        self.levels = []
+        self.capacity = 0
+        self.overflow = set()  # Reserved IDs above capacity
+        self.count = 0         # Slots in use
+        self._grow(capacity)
+
+    @classmethod
+    def from_array(cls, nums):
+        """
+        Build an allocator whose used slots are the positive values of `nums`.
+        
+        `nums` is only read, never modified (unlike firstMissingPositive2).
+        """
+        allocator = cls(max(64, len(nums)))
+        for x in nums:
+            if x > 0:
+                allocator.reserve(x)
+        return allocator
+
+    def _grow(self, capacity):
+        """
+        Resize level 0 to hold `capacity` slots and rebuild the summary levels.
+        """
+        words = max(1, -(-capacity // 64))
+        level0 = self.levels[0] if self.levels else array('Q')
+        if words > len(level0):
+            level0.extend(array('Q', bytes(8 * (words - len(level0)))))
+        self.capacity = words * 64
+        self.levels = [level0]
+        while len(self.levels[-1]) > 1:
+            below = self.levels[-1]
+            above = array('Q', bytes(8 * -(-len(below) // 64)))
+            for i, w in enumerate(below):
+                if w == _FULL:
+                    above[i >> 6] |= 1 << (i & 63)
+            self.levels.append(above)
+        for x in [x for x in self.overflow if x <= self.capacity]:
+            self.overflow.discard(x)
+            self._set(x - 1)
+
+    def _set(self, bit):
+        """
+        Mark a bit as used and propagate "word is full" upwards.
+        """
+        for level in self.levels:
+            i, mask = bit >> 6, 1 << (bit & 63)
+            level[i] |= mask
+            if level[i] != _FULL:
+                return
+            bit = i
+
+    def _clear(self, bit):
+        """
+        Mark a bit as free and propagate "word is no longer full" upwards.
+        """
+        for level in self.levels:
+            i, mask = bit >> 6, 1 << (bit & 63)
+            was_full = level[i] == _FULL
+            level[i] &= ~mask & _FULL
+            if not was_full:
+                return
+            bit = i
+
+    def is_used(self, x):
+        """
+        True if slot x is currently allocated (always False for x < 1).
+        """
+        if x < 1:
+            return False
+        if x > self.capacity:
+            return x in self.overflow
+        bit = x - 1
+        return bool(self.levels[0][bit >> 6] >> (bit & 63) & 1)
+
+    def first_missing(self):
+        """
+        Smallest positive slot that is not in use (the first missing positive).
+        """
+        i = 0
+        for level in reversed(self.levels):
+            # A padding bit past the last real word means every real word is full
+            if i >= len(level) or level[i] == _FULL:
+                x = self.capacity + 1
+                while x in self.overflow:
+                    x += 1
+                return x
+            w = level[i]
+            i = i * 64 + ((~w & (w + 1)).bit_length() - 1)  # Lowest 0 bit
+        return i + 1
+
+    def reserve(self, x):
+        """
+        Mark a specific slot x >= 1 as used (no-op if it already is).
+        """
+        if x < 1:
+            raise ValueError("slots are positive integers")
+        if self.is_used(x):
+            return
+        self.count += 1
+        if x > self.capacity:
+            self.overflow.add(x)
+        else:
+            self._set(x - 1)
+
+    def allocate(self):
+        """
+        Take the smallest free slot and return it.
+        """
+        x = self.first_missing()
+        if x > self.capacity:
+            self._grow(max(2 * self.capacity, x))
+        self.reserve(x)
+        return x
+
+    def release(self, x):
+        """
+        Free slot x so it can be handed out again (no-op if it is free).
+        """
+        if x < 1:
+            raise ValueError("slots are positive integers")
+        if not self.is_used(x):
+            return
+        self.count -= 1
+        if x > self.capacity:
+            self.overflow.discard(x)
+        else:
+            self._clear(x - 1)
+
+    def __len__(self):
+        return self.count
+
 def main():
     nums = [1, 2, 0]
     print(firstMissingPositive(nums))
     print(firstMissingPositive2(nums))
+    
+    allocator = FreeSlotAllocator.from_array([3, 4, -1, 1])
+    print(allocator.first_missing())  # Expected: 2
+    print(allocator.allocate())       # Expected: 2
+    print(allocator.first_missing())  # Expected: 5
+    allocator.release(3)
+    print(allocator.first_missing())  # Expected: 3
 
 if __name__ == '__main__':
     main()
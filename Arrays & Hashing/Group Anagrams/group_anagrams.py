@@ -1,3 +1,9 @@
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import time
+
 def groupAnagrams(strs):
     """
     Groups anagrams together from a list of words.
@@ -31,6 +37,140 @@ def groupAnagrams(strs):
         i += 1
     return res
 
+def sortedSignature(word):
+    """
+    Anagram signature: the word's characters in sorted order.
+    
+    Works for any alphabet. O(k log k) for a word of length k.
+    """
+    return ''.join(sorted(word))
+
+_ORD_A = ord('a')
+
+def countSignature(word):
+    """
+    Anagram signature: a 26-tuple of letter counts.
+    
+    O(k) for a word of length k, but only valid for lowercase a-z words.
+    
+    Raises:
+        ValueError: If the word contains a character outside a-z
+    """
+    count = [0] * 26
+    for c in word:
+        i = ord(c) - _ORD_A
+        if not 0 <= i < 26:
+            raise ValueError(f"countSignature only supports a-z, got {c!r} in {word!r}")
+        count[i] += 1
+    return tuple(count)
+
+_SIGNATURES = {'sorted': sortedSignature, 'count': countSignature}
+
+def groupAnagrams2(strs, signature='sorted'):
+    """
+    Groups anagrams together in a single pass using a signature -> group map.
+    
+    Every anagram of a word has the same signature (sorted characters, or
+    letter counts), so each word is hashed once into its group instead of
+    being compared against every other word. Works on any iterable, so a
+    generator of words (see readWords) is consumed lazily, and the input is
+    never modified.
+    
+    Time Complexity: O(n * k log k) with 'sorted', O(n * k) with 'count'
+    Space Complexity: O(n * k) for the groups
+    
+    Args:
+        strs (iterable): Words to group
+        signature (str): 'sorted' (any characters) or 'count' (a-z only)
+        
+    Returns:
+        list: A list of lists, one per anagram group, in first-seen order
+    """
+    return list(_groupMap(strs, signature).values())
+
+def _groupMap(strs, signature):
+    """
+    Build the signature -> words map behind groupAnagrams2.
+    """
+    key = _SIGNATURES[signature]
+    groups = defaultdict(list)
+    for word in strs:
+        groups[key(word)].append(word)
+    return groups
+
+def readWords(path, encoding='utf-8'):
+    """
+    Stream words from a file, one per line, without loading the file.
+    
+    Blank lines are skipped; surrounding whitespace is stripped.
+    """
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            word = line.strip()
+            if word:
+                yield word
+
+def groupAnagramsFile(path, signature='sorted'):
+    """
+    Group the anagrams of a word-per-line file (streaming input mode).
+    """
+    return groupAnagrams2(readWords(path), signature)
+
+def groupAnagramsParallel(strs, workers=None, signature='sorted', shards=None):
+    """
+    Group anagrams by hashing shards of the input in a process pool.
+    
+    The words are split into contiguous shards, each worker builds the
+    signature -> words map for its shard, and the partial maps are merged in
+    shard order, so the result matches groupAnagrams2 exactly.
+    
+    Time Complexity: O(n * k log k / workers) plus O(n) to merge
+    Space Complexity: O(n * k)
+    
+    Args:
+        strs (list): Words to group
+        workers (int): Number of processes (default: CPU count)
+        signature (str): 'sorted' or 'count'
+        shards (int): Number of shards (default: 4 per worker)
+        
+    Returns:
+        list: A list of lists, one per anagram group
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        shards = shards or 4 * workers
+        size = max(1, -(-len(strs) // shards))
+        parts = [strs[i:i + size] for i in range(0, len(strs), size)]
+        merged = defaultdict(list)
+        for groups in pool.map(_groupMap, parts, [signature] * len(parts)):
+            for sig, words in groups.items():
+                merged[sig].extend(words)
+    return list(merged.values())
+
+def benchmark(sizes=(2_000, 200_000, 2_000_000)):
+    """
+    Time groupAnagrams against groupAnagrams2 and groupAnagramsParallel.
+    
+    Words are random 3-8 letter strings drawn from a small alphabet so many
+    anagram groups form. The quadratic groupAnagrams is skipped above
+    2,000 words (it already takes ~50s at 20,000).
+    
+    Run with: python group_anagrams.py --bench
+    """
+    import random
+    rng = random.Random(0)
+    for n in sizes:
+        words = [''.join(rng.choices('abcdefgh', k=rng.randint(3, 8))) for _ in range(n)]
+        runs = [('groupAnagrams2 sorted', lambda: groupAnagrams2(words)),
+                ('groupAnagrams2 count', lambda: groupAnagrams2(words, 'count')),
+                ('groupAnagramsParallel', lambda: groupAnagramsParallel(words))]
+        if n <= 2_000:
+            runs.insert(0, ('groupAnagrams', lambda: groupAnagrams(list(words))))
+        for name, run in runs:
+            start = time.perf_counter()
+            groups = run()
+            print(f"n={n:>9,} {name:>22}: {time.perf_counter() - start:8.3f}s  groups={len(groups):,}")
+
 def main():
     """
     Main function that demonstrates the groupAnagrams function.
@@ -41,6 +181,10 @@ def main():
     input_data = ["act","pots","tops","cat","stop","hat"]
     result = groupAnagrams(input_data)
     print(result)
+    print(groupAnagrams2(["act","pots","tops","cat","stop","hat"], 'count'))
 
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -63,9 +63,87 @@ def longestConsecutive2(nums):
             
     return res
 
+class ConsecutiveRunTracker:
+    """
+    Tracks the longest run of consecutive values over a stream of inserts.
+    
+    Backed by a union-find (disjoint set) keyed on the values themselves:
+    every run of consecutive values is one set. Adding x creates a singleton
+    and unions it with the sets of x - 1 and x + 1 if they exist, so the
+    answer is just the size of the largest set seen so far.
+    
+    Union by size keeps trees shallow and path compression (halving) flattens
+    them on every find, so each update costs amortized near-O(1) time
+    (inverse Ackermann), and longest() is O(1) at any point in the stream.
+    
+    Space Complexity: O(N) for N distinct values added
+    """
+
+    def __init__(self, nums=()):
+        self.parent = {}  # value -> parent value in its run's tree
+        self.size = {}    # root value -> length of its run
+        self.best = 0
+        self.add_many(nums)
+
+    def _find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # Path halving
+            x = parent[x]
+        return x
+
+    def _union(self, a, b):
+        a, b = self._find(a), self._find(b)
+        if a == b:
+            return self.size[a]
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        # Attach the smaller run under the larger one
+        self.parent[b] = a
+        self.size[a] += self.size.pop(b)
+        return self.size[a]
+
+    def add(self, x):
+        """
+        Add a value; duplicates are ignored.
+        """
+        if x in self.parent:
+            return
+        self.parent[x] = x
+        self.size[x] = 1
+        length = 1
+        if x - 1 in self.parent:
+            length = self._union(x - 1, x)
+        if x + 1 in self.parent:
+            length = self._union(x, x + 1)
+        if length > self.best:
+            self.best = length
+
+    def add_many(self, nums):
+        """
+        Add every value of an iterable (e.g. one batch of incoming IDs).
+        """
+        for x in nums:
+            self.add(x)
+
+    def longest(self):
+        """
+        Length of the longest consecutive run among all values added so far.
+        """
+        return self.best
+
+    def __len__(self):
+        return len(self.parent)
+
 def main():
     nums = [9, 1, 4, 7, 3, -1, 0, 5, 8, -1, 6]
     print(longestConsecutive2(nums))
+    
+    # Same answer built up batch by batch
+    tracker = ConsecutiveRunTracker()
+    for batch in ([9, 1, 4], [7, 3, -1], [0, 5, 8, -1, 6]):
+        tracker.add_many(batch)
+        print(tracker.longest())
 
 if __name__ == '__main__':
     main()
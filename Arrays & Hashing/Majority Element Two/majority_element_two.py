@@ -52,10 +52,126 @@ def majorityElementTwo2(nums):
             res.append(i)
     return res
 
+
+class HeavyHitters:
+    """
+    Mergeable Misra-Gries summary: finds every element occurring more than n / k times.
+    
+    Keeps at most k - 1 counters. A new element takes a free counter; when
+    all counters are busy, every counter is decreased together with the
+    newcomer (the "cancel k distinct elements" step of majorityElementTwo2,
+    generalized from 3 to k and done in place instead of rebuilding a dict).
+    Any element with frequency > n / k survives, so the surviving keys are a
+    superset of the answer, and each counter underestimates its true count by
+    at most n / k.
+    
+    Two summaries built over different shards can be combined with merge(),
+    so workers can summarize parts of a huge file independently.
+    
+    Time Complexity: O(1) amortized per update, O(k) per merge
+    Space Complexity: O(k)
+    """
+
+    def __init__(self, k=3):
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self.k = k
+        self.counters = {}
+        self.n = 0  # Total weight seen, including merged summaries
+
+    def update(self, x, count=1):
+        """
+        Record `count` more occurrences of x.
+        """
+        self.n += count
+        counters = self.counters
+        if x in counters:
+            counters[x] += count
+            return
+        while count > 0 and len(counters) >= self.k - 1:
+            # Cancel the newcomer against every tracked element at once
+            dec = min(count, min(counters.values()))
+            count -= dec
+            for key in list(counters):
+                counters[key] -= dec
+                if not counters[key]:
+                    del counters[key]
+        if count > 0:
+            counters[x] = count
+
+    def update_many(self, nums):
+        """
+        Record every element of an iterable (consumed once, lazily).
+        """
+        for x in nums:
+            self.update(x)
+
+    def merge(self, other):
+        """
+        Fold another summary with the same k into this one.
+        
+        Counters are added, then the k-th largest count is subtracted from all
+        of them and non-positive ones are dropped, which keeps at most k - 1
+        counters and the same n / k error bound over the combined stream.
+        
+        Returns:
+            HeavyHitters: self, to allow chaining
+        """
+        if other.k != self.k:
+            raise ValueError("cannot merge summaries with different k")
+        counters = self.counters
+        for x, c in other.counters.items():
+            counters[x] = counters.get(x, 0) + c
+        self.n += other.n
+        if len(counters) >= self.k:
+            cut = sorted(counters.values(), reverse=True)[self.k - 1]
+            self.counters = {x: c - cut for x, c in counters.items() if c > cut}
+        return self
+
+    def candidates(self):
+        """
+        Elements that may occur more than n / k times (no false negatives).
+        """
+        return list(self.counters)
+
+    def verify(self, nums):
+        """
+        Exact pass: keep only candidates that really occur more than n / k times.
+        
+        Streams `nums` (the same data the summary was built from) once,
+        counting only the at most k - 1 candidates.
+        
+        Returns:
+            list: Elements occurring more than n / k times
+        """
+        exact = dict.fromkeys(self.counters, 0)
+        for x in nums:
+            if x in exact:
+                exact[x] += 1
+        return [x for x, c in exact.items() if c > self.n // self.k]
+
+
+def majorityElementTwo3(nums):
+    """
+    Finds all elements that appear more than ⌊n / 3⌋ times with a HeavyHitters summary.
+    Time Complexity: O(N) - one pass to summarize, one pass to verify the 2 candidates.
+    Space Complexity: O(1) - at most 2 counters.
+    """
+    summary = HeavyHitters(3)
+    summary.update_many(nums)
+    return summary.verify(nums)
+
 def main():
     nums = [3,2,3]
     print(majorityElementTwo(nums))
     print(majorityElementTwo2(nums))
+    print(majorityElementTwo3(nums))
+    
+    # Two shards summarized separately, then merged
+    left, right = HeavyHitters(3), HeavyHitters(3)
+    left.update_many([1, 1, 2])
+    right.update_many([1, 3, 1, 4])
+    print(left.merge(right).verify([1, 1, 2, 1, 3, 1, 4]))  # Expected: [1]
 
 if __name__ == '__main__':
     main()
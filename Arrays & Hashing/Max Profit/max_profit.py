@@ -1,3 +1,11 @@
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the multi-ticker helpers need it
+    np = None
+
 def maxProfit(prices):
     """
     Calculates the maximum profit from buying and selling a stock multiple times.
@@ -39,10 +47,116 @@ def maxProfit2(prices):
             profit += prices[i] - prices[i-1]
     return profit
 
+def maxProfitMatrix(prices):
+    """
+    Calculates maxProfit2 for every row of a 2-D price matrix at once.
+    The greedy rule "take every positive day-to-day move" becomes one
+    diff -> clip -> sum over the whole matrix, with no Python-level loop.
+    
+    Args:
+        prices: (tickers, ticks) array-like of prices
+        
+    Returns:
+        numpy.ndarray: (tickers,) profit per row
+    """
+    if np is None:
+        raise ImportError("maxProfitMatrix requires NumPy")
+    prices = np.asarray(prices)
+    # Unsigned prices would wrap around in diff; promote to a signed/float dtype
+    prices = prices.astype(np.result_type(prices.dtype, np.int64), copy=False)
+    return np.clip(np.diff(prices, axis=1), 0, None).sum(axis=1)
+
+class ProfitAccumulator:
+    """
+    Running maxProfit2 per ticker over live tick streams.
+    Keeps only the last price and the profit so far for each ticker, so each
+    new tick costs O(1) and no price history is stored.
+    """
+
+    def __init__(self):
+        self.last = {}    # ticker -> last seen price
+        self.profit = {}  # ticker -> profit captured so far
+
+    def update(self, ticker, price):
+        """
+        Feed one tick and return the ticker's profit so far.
+        """
+        prev = self.last.get(ticker)
+        self.last[ticker] = price
+        gain = price - prev if prev is not None and price > prev else 0
+        self.profit[ticker] = self.profit.get(ticker, 0) + gain
+        return self.profit[ticker]
+
+    def update_many(self, ticks):
+        """
+        Feed an iterable of (ticker, price) ticks in arrival order.
+        """
+        for ticker, price in ticks:
+            self.update(ticker, price)
+
+class VectorProfitAccumulator:
+    """
+    Running maxProfit2 for a fixed set of tickers updated together.
+    Each push() takes one price per ticker (e.g. a snapshot of the whole
+    book) and updates every profit with one vectorized clip.
+    """
+
+    def __init__(self, tickers):
+        if np is None:
+            raise ImportError("VectorProfitAccumulator requires NumPy")
+        self.last = None
+        self.profit = np.zeros(tickers)
+
+    def push(self, prices):
+        """
+        Feed one price per ticker and return the profit array.
+        """
+        prices = np.asarray(prices, dtype=self.profit.dtype)
+        if self.last is not None:
+            self.profit += np.clip(prices - self.last, 0, None)
+        self.last = prices.copy()
+        return self.profit
+
+def benchmark(tickers=50_000, ticks=10_000):
+    """
+    Compares maxProfitMatrix against calling maxProfit2 on every row.
+    The matrix is processed in row blocks so the float64 temporary stays
+    around 1 GB; the per-row loop is timed on the first 500 rows and
+    extrapolated.
+    
+    Run with: python max_profit.py --bench
+    """
+    rng = np.random.default_rng(0)
+    block = max(1, (1 << 27) // ticks)
+    elapsed = 0.0
+    for lo in range(0, tickers, block):
+        rows = min(block, tickers - lo)
+        prices = 100 + rng.standard_normal((rows, ticks)).cumsum(axis=1)
+        start = time.perf_counter()
+        profits = maxProfitMatrix(prices)
+        elapsed += time.perf_counter() - start
+        if lo == 0:
+            sample = prices[:500].tolist()
+            start = time.perf_counter()
+            loopProfits = [maxProfit2(row) for row in sample]
+            loopTime = (time.perf_counter() - start) * tickers / len(sample)
+            checked = np.allclose(profits[:len(sample)], loopProfits)
+    print(f"{tickers:,} x {ticks:,}: maxProfitMatrix {elapsed:8.2f}s, "
+          f"maxProfit2 loop ~{loopTime:8.2f}s (extrapolated), results match: {checked}")
+
 def main():
     prices = [7,1,5,3,6,4]
     print(maxProfit(prices))
     print(maxProfit2(prices))
+    
+    acc = ProfitAccumulator()
+    acc.update_many(("AAPL", p) for p in prices)
+    print(acc.profit["AAPL"])
+    if np is not None:
+        print(maxProfitMatrix([prices, prices[::-1]]))  # Expected: [ 7 10]
 
 if __name__ == '__main__':
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
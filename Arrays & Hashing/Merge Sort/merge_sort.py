@@ -1,3 +1,10 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import heapq
+from itertools import count, islice
+import os
+import tempfile
+
 def mergeSort(nums):
     """
     Sort an array using the Merge Sort algorithm (in-place modification).
@@ -74,6 +81,143 @@ def merge(left, right, nums):
         j += 1
         k += 1
 
+def mergeSort2(nums):
+    """
+    Sort a list with bottom-up Merge Sort using one reusable scratch buffer.
+    
+    Instead of slicing copies of every half on the way down, the array is
+    treated as sorted runs of width 1, 2, 4, ... and neighbouring runs are
+    merged from one buffer into the other. The two buffers swap roles after
+    each pass, so the only allocation is a single scratch list of size n.
+    
+    Time Complexity: O(n log n)
+    Space Complexity: O(n) for the one scratch buffer, no recursion
+    
+    Args:
+        nums (list): The array to be sorted (modified in-place)
+    """
+    n = len(nums)
+    src, dst = nums, [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _mergeRuns(src, lo, mid, hi, dst)
+        src, dst = dst, src
+        width *= 2
+    # After an odd number of passes the sorted data lives in the scratch buffer
+    if src is not nums:
+        nums[:] = src
+
+def _mergeRuns(src, lo, mid, hi, dst):
+    """
+    Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    """
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+    # Copy whichever run is left with one slice assignment
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+def _sortedChunk(chunk):
+    """
+    Worker entry point: sort one chunk and send it back.
+    """
+    mergeSort2(chunk)
+    return chunk
+
+def parallelMergeSort(nums, workers=None):
+    """
+    Sort a list using all cores: sort chunks in a process pool, then k-way merge.
+    
+    The list is split into one chunk per worker, each chunk is sorted with
+    mergeSort2 in its own process, and the sorted chunks are merged back
+    into nums with a heap-based k-way merge.
+    
+    Time Complexity: O((n / p) log(n / p)) per worker + O(n log p) to merge
+    Space Complexity: O(n) for the chunks
+    
+    Args:
+        nums (list): The array to be sorted (modified in-place)
+        workers (int): Number of processes (default: CPU count)
+    """
+    workers = workers or os.cpu_count() or 1
+    size = max(1, -(-len(nums) // workers))
+    chunks = [nums[i:i + size] for i in range(0, len(nums), size)]
+    if len(chunks) < 2:
+        mergeSort2(nums)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        runs = list(pool.map(_sortedChunk, chunks))
+    nums[:] = heapq.merge(*runs)
+
+def _mergeRunFiles(paths, out_path):
+    """
+    k-way merge sorted run files into out_path, deleting each run once consumed.
+    """
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path)) for path in paths]
+        with open(out_path, 'w') as out:
+            out.writelines(f"{x}\n" for x in heapq.merge(*((int(line) for line in f) for f in files)))
+    for path in paths:
+        os.unlink(path)
+
+def externalMergeSort(in_path, out_path, run_size=1_000_000, fan_in=64):
+    """
+    Sort a file of integers (one per line) that may be larger than memory.
+    
+    Phase 1: read at most run_size numbers at a time, sort them with
+    mergeSort2 and write each sorted run to a temporary file (closed again
+    right away).
+    Phase 2: merge the runs fan_in at a time through a k-way heap merge,
+    pass after pass, until at most fan_in remain; the last merge writes
+    out_path. Only one line per open run is in memory, and never more than
+    fan_in run files are open, whatever the number of runs.
+    
+    Time Complexity: O(n log n), with O(log_fan_in(runs)) passes over the data
+    Space Complexity: O(run_size) memory, O(n) temporary disk
+    
+    Args:
+        in_path (str): Input file, one integer per line
+        out_path (str): Output file, same format, sorted ascending
+        run_size (int): Numbers held in memory per run
+        fan_in (int): Most runs merged (and open) at once, at least 2
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    with tempfile.TemporaryDirectory() as tmp:
+        names = (os.path.join(tmp, f"run-{i}") for i in count())
+        runs = []
+        with open(in_path) as f:
+            while True:
+                window = list(islice(f, run_size))
+                if not window:  # EOF
+                    break
+                chunk = [int(line) for line in window if line.strip()]
+                if not chunk:  # Only blank lines in this window
+                    continue
+                mergeSort2(chunk)
+                runs.append(next(names))
+                with open(runs[-1], 'w') as run:
+                    run.writelines(f"{x}\n" for x in chunk)
+        while len(runs) > fan_in:  # One merge pass
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                merged.append(next(names))
+                _mergeRunFiles(runs[i:i + fan_in], merged[-1])
+            runs = merged
+        _mergeRunFiles(runs, out_path)
+
 def main():
     """
     Main function to demonstrate merge sort.
@@ -91,6 +235,11 @@ def main():
     
     # Print the sorted array
     print(nums)
+    
+    # Same input through the bottom-up variant
+    nums = [10, 9, 1, 1, 1, 2, 3, 1]
+    mergeSort2(nums)
+    print(nums)
 
 if __name__ == '__main__':
     main()
@@ -21,7 +21,20 @@ Complexity Analysis:
   taking O(n) time. The overall time complexity is O(n).
 - Space Complexity: O(1) auxiliary space. The output array used to return the result does not count 
   towards extra space complexity for this problem. The `postfix` variable only takes constant O(1) space.
+
+NumPy variants:
+---------------
+- productArrayExceptSelfNumpy: the same prefix/postfix idea with np.cumprod, plus
+  an optional log-domain result for products that would overflow.
+- productArrayExceptSelfInto: two chunked passes over a (possibly memory-mapped)
+  array that write into a caller-supplied output buffer, so memory use is bounded
+  by the chunk size.
 """
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; productArrayExceptSelf needs only lists
+    np = None
+
 def productArrayExceptSelf(nums):
     # Initialize the prefix array with 1s. This output array will first 
     # store the product of all elements to the left of the current index.
@@ -50,9 +63,117 @@ def productArrayExceptSelf(nums):
     # Return the modified prefix array which now holds our final answer.
     return prefix
 
+def _requireNumpy():
+    if np is None:
+        raise ImportError("this variant requires NumPy")
+
+def productArrayExceptSelfNumpy(nums, log_domain=False):
+    """
+    Vectorized product of array except self, without division.
+    
+    Zeros are handled explicitly instead of relying on prefix * postfix:
+    - two or more zeros: every product is 0
+    - one zero at index z: only answer[z] is non-zero (product of the rest)
+    - no zeros: exclusive prefix cumprod * exclusive postfix cumprod
+    This also avoids 0 * inf = nan when a float product overflows.
+    
+    With log_domain=True the result is returned as (sign, log_abs) so that
+    answer[i] == sign[i] * exp(log_abs[i]) never overflows: log_abs is the
+    total log-magnitude minus log|nums[i]|, and zero products get sign 0 and
+    log_abs -inf.
+    
+    Time Complexity: O(n), vectorized
+    Space Complexity: O(n) for the output (plus one temporary of size n)
+    
+    Returns:
+        numpy.ndarray, or (sign, log_abs) arrays when log_domain is True
+    """
+    _requireNumpy()
+    a = np.asarray(nums)
+    zeros = np.flatnonzero(a == 0)
+    if log_domain:
+        sign = np.zeros(len(a), dtype=np.int8)
+        log_abs = np.full(len(a), -np.inf)
+        if len(zeros) > 1:
+            return sign, log_abs
+        if len(zeros) == 1:
+            rest = np.delete(a, zeros[0])
+            sign[zeros[0]] = np.prod(np.sign(rest))
+            log_abs[zeros[0]] = np.log(np.abs(rest).astype(np.float64)).sum()
+            return sign, log_abs
+        logs = np.log(np.abs(a).astype(np.float64))
+        negative = a < 0
+        # Sign of the product of the others: flip the total sign where nums[i] < 0
+        total_negative = np.count_nonzero(negative) & 1
+        sign[:] = np.where(negative ^ bool(total_negative), -1, 1)
+        return sign, logs.sum() - logs
+    out = np.zeros_like(a)
+    if len(zeros) > 1 or not len(a):
+        return out
+    if len(zeros) == 1:
+        out[zeros[0]] = np.prod(np.delete(a, zeros[0]))
+        return out
+    # Exclusive prefix products: out[i] = nums[0] * ... * nums[i-1]
+    out[0] = 1
+    np.cumprod(a[:-1], out=out[1:])
+    # Multiply by exclusive postfix products: nums[i+1] * ... * nums[n-1]
+    postfix = np.ones_like(a)
+    np.cumprod(a[:0:-1], out=postfix[-2::-1])
+    out *= postfix
+    return out
+
+def productArrayExceptSelfInto(nums, out, chunk_size=1 << 20):
+    """
+    Product of array except self over huge arrays in two streaming passes.
+    
+    `nums` and `out` can be np.memmap arrays (or any NumPy arrays of equal
+    length); nothing larger than one chunk is ever allocated.
+    1. Forward pass: out[i] = product of everything left of i, chunk by chunk,
+       carrying the running product between chunks.
+    2. Backward pass: multiply out[i] by the product of everything right of i,
+       again chunk by chunk with a carried running product.
+    
+    Uses out's dtype for the arithmetic; integer products wrap on overflow,
+    so prefer a float `out` (or productArrayExceptSelfNumpy with
+    log_domain=True) when products can be huge.
+    
+    Time Complexity: O(n)
+    Space Complexity: O(chunk_size) beyond the caller's buffers
+    
+    Returns:
+        The `out` buffer
+    """
+    _requireNumpy()
+    n = len(nums)
+    if len(out) != n:
+        raise ValueError("out must have the same length as nums")
+    dtype = out.dtype
+    carry = dtype.type(1)
+    for lo in range(0, n, chunk_size):
+        hi = min(lo + chunk_size, n)
+        chunk = np.asarray(nums[lo:hi], dtype=dtype)
+        out[lo] = carry
+        np.cumprod(chunk[:-1], out=out[lo + 1:hi])
+        out[lo + 1:hi] *= carry
+        carry = carry * np.prod(chunk)
+    carry = dtype.type(1)
+    for hi in range(n, 0, -chunk_size):
+        lo = max(hi - chunk_size, 0)
+        chunk = np.asarray(nums[lo:hi], dtype=dtype)
+        postfix = np.empty(hi - lo, dtype=dtype)
+        postfix[-1] = carry
+        np.cumprod(chunk[:0:-1], out=postfix[-2::-1])
+        postfix[:-1] *= carry
+        out[lo:hi] *= postfix
+        carry = carry * np.prod(chunk)
+    return out
+
 def main():
     nums = [1,2,3,4]
     print(productArrayExceptSelf(nums))
+    if np is not None:
+        print(productArrayExceptSelfNumpy(nums))                           # [24 12  8  6]
+        print(productArrayExceptSelfInto(np.array(nums), np.empty(4), 3))  # [24. 12.  8.  6.]
 
 if __name__ == '__main__':
     main()
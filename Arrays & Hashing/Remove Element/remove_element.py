@@ -7,7 +7,18 @@ a list in-place and return the count of remaining elements.
 Two approaches:
 1. RemoveElement: Bubble shift approach (less efficient)
 2. RemoveElement2: Two-pointer approach (optimal)
+
+For large typed buffers, compact() drops one or many values from an
+array / bytearray / memoryview / NumPy buffer chunk by chunk, moving whole
+runs of kept elements at once.
 """
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; compact() also works on plain buffers
+    np = None
+
 
 def RemoveElement(nums, val):
     """
@@ -102,6 +113,86 @@ def RemoveElement2(nums, val):
     return k
 
 
+def compact(buf, vals, chunk_size=1 << 16):
+    """
+    Remove every occurrence of one or many values from a writable buffer in-place.
+    
+    ALGORITHM EXPLANATION:
+    - Same read/write pointer idea as RemoveElement2, but a chunk at a time
+    - Each chunk is copied into a chunk-sized scratch buffer, the kept
+      elements are found with C-level operations, and they are written back at
+      the write pointer with slice assignment
+      - NumPy arrays: one vectorized ~isin mask per chunk
+      - 1-byte buffers (bytearray, array('B')): one bytes.translate call that
+        deletes every dropped value
+      - other typed buffers: the dropped positions are located with
+        array.index and the runs between them are moved as slices
+    - The write pointer never overtakes the read pointer, so writing back into
+      the same buffer is safe, and nothing larger than one chunk is allocated
+    
+    TIME COMPLEXITY: O(n * len(vals)) C-level scanning, O(number of dropped runs) Python steps
+    SPACE COMPLEXITY: O(chunk_size) scratch
+    
+    Args:
+        buf: array, bytearray, writable memoryview, or NumPy array (1-D)
+        vals: A single value or an iterable of values to drop
+        chunk_size (int): Elements processed per step
+        
+    Returns:
+        int: The new logical length; buf[:length] holds the kept elements in order
+    """
+    vals = list(vals) if hasattr(vals, '__iter__') else [vals]
+    if np is not None and isinstance(buf, np.ndarray):
+        drop = np.asarray(vals)
+        k = 0
+        for lo in range(0, len(buf), chunk_size):
+            chunk = buf[lo:lo + chunk_size]
+            kept = chunk[~np.isin(chunk, drop)]
+            buf[k:k + len(kept)] = kept
+            k += len(kept)
+        return k
+    view = memoryview(buf)
+    fmt = view.format
+    deleted = b''.join(_packed(fmt, v) for v in vals) if view.itemsize == 1 else None
+    k = 0
+    for lo in range(0, len(view), chunk_size):
+        chunk = array(fmt, view[lo:lo + chunk_size])
+        if deleted is not None:
+            kept = array(fmt, chunk.tobytes().translate(None, deleted))
+            view[k:k + len(kept)] = kept
+            k += len(kept)
+            continue
+        # Positions of every dropped element in this chunk, in order
+        cuts = []
+        for v in vals:
+            pos = 0
+            while True:
+                try:
+                    pos = chunk.index(v, pos)
+                except (ValueError, OverflowError, TypeError):
+                    break
+                cuts.append(pos)
+                pos += 1
+        cuts.sort()
+        start = 0
+        for cut in cuts + [len(chunk)]:
+            if cut > start:
+                view[k:k + cut - start] = chunk[start:cut]
+                k += cut - start
+            start = cut + 1
+    return k
+
+
+def _packed(fmt, v):
+    """
+    The raw bytes of v stored as type `fmt`, or b'' if v does not fit.
+    """
+    try:
+        return array(fmt, [v]).tobytes()
+    except (OverflowError, TypeError):
+        return b''
+
+
 # COMPARISON OF APPROACHES:
 # 
 # Approach 1 (RemoveElement):
@@ -144,6 +235,12 @@ def main():
     print(f"  Result count: {RemoveElement2(nums2, val2)}")
     print(f"  Modified array (first {RemoveElement2([0, 1, 2, 2, 3, 0, 4, 2], 2)} elements are valid): {nums2}")
 
+    # Test Case 3: compact drops several values from a typed buffer
+    buf = array('q', [0, 1, 2, 2, 3, 0, 4, 2])
+    k = compact(buf, [2, 0])
+    print(f"\nTest 3 - compact:")
+    print(f"  Result count: {k}, kept: {list(buf[:k])}")  # Expected: 3, [1, 3, 4]
+
 
 if __name__ == "__main__":
     main()
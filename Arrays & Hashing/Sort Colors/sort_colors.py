@@ -1,3 +1,11 @@
+from array import array
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; countingSort also works on memoryviews
+    np = None
+
 def sortColors(nums):
     """
     Sort an array containing only 0, 1, and 2 in-place (Dutch National Flag problem).
@@ -35,6 +43,128 @@ def sortColors(nums):
             position += 1           # Move to next position
             counter[i] -= 1         # Decrease the count
 
+def countingSort(buf, lo, hi):
+    """
+    Sort a buffer of small-range integers in-place with counting sort.
+    
+    Generalizes sortColors from the values 0..2 to any key range lo..hi.
+    Counting uses C-level scans: bytes.count / Counter for 1-byte buffers,
+    the buffer's own count() for small ranges, np.bincount for NumPy
+    arrays. The range check falls out of the counts (they must add up to
+    the length), and every run of equal values is written with one slice
+    assignment instead of one write per element.
+    
+    Time Complexity: O(n + (hi - lo))
+    Space Complexity: O(hi - lo) for the counts (plus one run of filler),
+                      and one n-byte copy for 1-byte buffers
+    
+    Args:
+        buf: array('B'/'H'/...), bytearray, a writable memoryview, or a NumPy array
+        lo (int): Smallest possible value
+        hi (int): Largest possible value
+        
+    Raises:
+        ValueError: If the buffer holds values outside lo..hi
+    """
+    if np is not None and isinstance(buf, np.ndarray):
+        if buf.size and (buf.min() < lo or buf.max() > hi):
+            raise ValueError(f"values outside the range {lo}..{hi}")
+        counts = np.bincount(buf.ravel() - lo if lo else buf.ravel(), minlength=hi - lo + 1)
+        buf[...] = np.repeat(np.arange(lo, hi + 1, dtype=buf.dtype), counts).reshape(buf.shape)
+        return
+    view = memoryview(buf)
+    if view.format in ('B', 'b'):
+        counts = _countBytes(view, lo, hi)
+    elif hasattr(buf, 'count') and hi - lo < 64:
+        # One C-level scan per key beats a Python-level loop over every element
+        counts = [buf.count(v) for v in range(lo, hi + 1)]
+    else:
+        counts = _countRange(view, lo, hi)
+    # Every element was counted exactly once only if all of them are in range
+    if sum(counts) != len(view):
+        raise ValueError(f"values outside the range {lo}..{hi}")
+    position = 0
+    for offset, c in enumerate(counts):
+        if c:
+            view[position:position + c] = array(view.format, [lo + offset]) * c
+            position += c
+
+def _countBytes(view, lo, hi):
+    """
+    Counts of every key lo..hi in a 1-byte ('B' or 'b') memoryview.
+    
+    The buffer is copied to bytes once; a few keys are then counted with
+    bytes.count (a memchr-speed scan each), more keys with one C-level
+    Counter pass. Keys the format cannot hold get a count of 0.
+    """
+    data = bytes(view)
+    signed = view.format == 'b'
+    keys = range(lo, hi + 1)
+    if len(keys) <= 12:
+        return [data.count(v & 0xFF) if (-128 <= v < 128 if signed else 0 <= v < 256) else 0
+                for v in keys]
+    byteCounts = Counter(data)
+    counts = [0] * len(keys)
+    for b, c in byteCounts.items():
+        v = b - 256 if signed and b >= 128 else b
+        if lo <= v <= hi:
+            counts[v - lo] = c
+    return counts
+
+def _countRange(view, lo, hi):
+    """
+    Counts of every key lo..hi, tallied by Counter's C loop over the view.
+    
+    Raises:
+        ValueError: If the view holds values outside lo..hi
+    """
+    counts = [0] * (hi - lo + 1)
+    for v, c in Counter(view).items():
+        if not lo <= v <= hi:
+            raise ValueError(f"values outside the range {lo}..{hi}")
+        counts[v - lo] = c
+    return counts
+
+def countingSortPermutation(buf, lo, hi):
+    """
+    Stable counting sort that returns a permutation instead of moving data.
+    
+    perm[i] is the index in `buf` of the element that belongs at sorted
+    position i; equal keys keep their original order. Apply it to other
+    columns to sort records by this key (a building block for LSD radix
+    sort).
+    
+    NumPy arrays use a stable argsort directly. Other buffers are counted
+    with Counter (a C-level loop, which also checks the range); with NumPy
+    installed the positions then come from a stable argsort of a zero-copy
+    view, otherwise from one Python pass that drops every index into its
+    key's next slot.
+    
+    Time Complexity: O(n + (hi - lo))
+    Space Complexity: O(n) for the permutation
+    
+    Returns:
+        array('Q') (or a NumPy intp array when buf is a NumPy array)
+    """
+    if np is not None and isinstance(buf, np.ndarray):
+        if buf.size and (buf.min() < lo or buf.max() > hi):
+            raise ValueError(f"values outside the range {lo}..{hi}")
+        return np.argsort(buf.ravel(), kind='stable')
+    view = memoryview(buf)
+    counts = _countRange(view, lo, hi)
+    if np is not None:
+        perm = np.argsort(np.asarray(view), kind='stable').astype(np.uint64)
+        return array('Q', perm.tobytes())
+    # Prefix sums: starts[k] = first sorted position of key lo + k
+    starts = [0] * len(counts)
+    for k in range(1, len(counts)):
+        starts[k] = starts[k - 1] + counts[k - 1]
+    perm = array('Q', bytes(8 * len(view)))
+    for i, v in enumerate(view):
+        perm[starts[v - lo]] = i
+        starts[v - lo] += 1
+    return perm
+
 def main():
     """
     Main function to demonstrate sorting colors (0s, 1s, and 2s).
@@ -52,6 +182,12 @@ def main():
     
     # Print the sorted array
     print(nums)
+    
+    # Same idea on a typed buffer with a wider key range
+    codes = array('B', [5, 3, 5, 0, 3, 1])
+    print(list(countingSortPermutation(codes, 0, 5)))  # Expected: [3, 5, 1, 4, 0, 2]
+    countingSort(codes, 0, 5)
+    print(list(codes))                                  # Expected: [0, 1, 3, 3, 5, 5]
 
 if __name__ == '__main__':
     main()
@@ -1,3 +1,12 @@
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths still work
+    np = None
+
 def subArraySum(nums, k):
     """
     Finds the total number of continuous subarrays whose sum equals to k.
@@ -30,6 +39,152 @@ def subArraySum(nums, k):
         
     return res
 
+def subArraySumBatch(nums, ks):
+    """
+    Counts the subarrays summing to each k in `ks`, computing prefix sums only once.
+    
+    With NumPy, prefix sums P (with a leading 0) are built with one cumsum and
+    every prefix is tagged by its rank among the distinct prefix values.
+    Sorting (rank, position) pairs once lets each k be answered with two
+    vectorized searchsorted calls: for every end position j, count the start
+    positions i < j whose prefix equals P[j] - k.
+    
+    Without NumPy, a single pass over nums updates one prefix dictionary and
+    looks up every k at each element.
+    
+    Time Complexity: O(N log N + K * N log N) with NumPy, O(N * K) without
+    Space Complexity: O(N)
+    
+    Returns:
+        dict: k -> number of subarrays summing to k
+    """
+    ks = list(dict.fromkeys(ks))  # A repeated k is counted once
+    if np is None:
+        return _countChunk(nums, ks, {0: 1})[0]
+    prefix = np.concatenate(([0], np.cumsum(np.asarray(nums, dtype=np.int64))))
+    m = len(prefix)
+    values, rank = np.unique(prefix, return_inverse=True)
+    # (rank, position) pairs in sorted order; rank * m + position is unique
+    order = np.argsort(rank, kind='stable')
+    keys = rank[order] * m + order
+    starts = np.searchsorted(keys, np.arange(len(values)) * m)  # First key of every rank
+    # Visiting end positions in `order` keeps every searchsorted needle
+    # below ascending (value - k preserves order), which is far more
+    # cache-friendly than random needles.
+    sortedPrefix = prefix[order]
+    res = {}
+    for k in ks:
+        targets = sortedPrefix - k
+        t = np.searchsorted(values, targets).clip(max=len(values) - 1)
+        hit = np.flatnonzero(values[t] == targets)  # End positions whose target prefix exists
+        t = t[hit]
+        # Earlier occurrences of the target prefix = keys between (rank, 0) and (rank, j)
+        res[k] = int((np.searchsorted(keys, t * m + order[hit]) - starts[t]).sum())
+    return res
+
+def _countChunk(nums, ks, prefixSum, curSum=0):
+    """
+    Run the subArraySum loop for many k at once on top of an existing prefix map.
+    
+    Returns:
+        tuple: (dict k -> count, final cumulative sum)
+    """
+    res = dict.fromkeys(ks, 0)
+    for i in nums:
+        curSum += i
+        for k in ks:
+            res[k] += prefixSum.get(curSum - k, 0)
+        prefixSum[curSum] = prefixSum.get(curSum, 0) + 1
+    return res, curSum
+
+def summarizeChunk(chunk, ks):
+    """
+    Summarize one shard of a series independently of the others.
+    
+    Returns:
+        tuple: (counts of subarrays that lie entirely inside the chunk and
+        sum to each k, Counter of the chunk's local prefix sums
+        chunk[0:e] for e = 1..len(chunk), chunk total)
+    """
+    ks = list(dict.fromkeys(ks))
+    prefixSum = {}
+    counts, total = _countChunk(chunk, ks, prefixSum)
+    # Subarrays starting at the chunk's first element were not counted
+    # because the local prefix 0 was left out; add them here.
+    for k in ks:
+        counts[k] += prefixSum.get(k, 0)
+    return counts, Counter(prefixSum), total
+
+class SubarraySumAccumulator:
+    """
+    Merges chunk summaries, in series order, into exact subarray-sum counts.
+    
+    Keeps the counts of every global prefix sum seen so far. A subarray that
+    crosses into a new chunk starts at some earlier global prefix G and ends
+    at total + local prefix v, so for each k it adds
+    sum(count(v) * G[total + v - k]) over the chunk's local prefixes.
+    
+    Space Complexity: O(distinct prefix sums), the same map subArraySum keeps
+    """
+
+    def __init__(self, ks):
+        self.ks = list(dict.fromkeys(ks))
+        self.counts = dict.fromkeys(self.ks, 0)
+        self.prefixSum = Counter({0: 1})
+        self.total = 0
+
+    def merge(self, summary):
+        """
+        Fold in the summary (from summarizeChunk) of the next chunk.
+        """
+        counts, local, chunkTotal = summary
+        prefixSum, total = self.prefixSum, self.total
+        for k in self.ks:
+            cross = 0
+            for v, c in local.items():
+                cross += c * prefixSum.get(total + v - k, 0)
+            # Start positions inside the chunk were already counted locally,
+            # but the chunk's own starting prefix (total) is in prefixSum
+            self.counts[k] += counts[k] + cross - local.get(k, 0)
+        for v, c in local.items():
+            prefixSum[total + v] += c
+        self.total = total + chunkTotal
+        return self
+
+    def add_chunk(self, chunk):
+        """
+        Summarize and merge the next chunk in one step.
+        """
+        return self.merge(summarizeChunk(chunk, self.ks))
+
+def subArraySumChunked(chunks, ks, workers=None):
+    """
+    Counts subarrays summing to each k over a series given as consecutive chunks.
+    
+    Only one chunk (plus the prefix map) is held at a time, so `chunks` can be
+    a generator reading a series too large for memory. With `workers`, the
+    chunks are summarized in a process pool and merged in order; at most
+    2 * workers chunks are in flight, so the generator is still consumed
+    lazily.
+    
+    Returns:
+        dict: k -> number of subarrays summing to k
+    """
+    acc = SubarraySumAccumulator(ks)
+    if workers:
+        chunks = iter(chunks)
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque(pool.submit(summarizeChunk, chunk, acc.ks)
+                            for chunk in islice(chunks, 2 * workers))
+            while pending:
+                acc.merge(pending.popleft().result())
+                for chunk in islice(chunks, 1):
+                    pending.append(pool.submit(summarizeChunk, chunk, acc.ks))
+    else:
+        for chunk in chunks:
+            acc.add_chunk(chunk)
+    return acc.counts
+
 def main():
     nums = [2, 1, -1, 2]
     k = 2
@@ -37,6 +192,11 @@ def main():
     # Expected output: 4
     # Valid subarrays: [2], [2, 1, -1], [1, -1, 2], [2]
     print(subArraySum(nums, k))
+    
+    # Several k values at once, and the same series split into two chunks
+    print(subArraySumBatch(nums, [2, 1, 3]))          # Expected: {2: 4, 1: 2, 3: 1}
+    print(subArraySumChunked([[2, 1], [-1, 2]], [2, 1, 3]))
+    print(subArraySumChunked([[2, 1], [-1, 2]], [2, 2]))  # Repeated k: {2: 4}
 
 if __name__ == '__main__':
     main()
@@ -1,3 +1,10 @@
+from array import array
+import hashlib
+import heapq
+import itertools
+import sys
+import time
+
 def topKFrequent(nums, k):
     """
     Find the k most frequent elements in an array using dictionary + sorting.
@@ -82,6 +89,204 @@ def topKFrequent2(nums, k):
             if len(res) == k:
                 return res
 
+_MASK64 = (1 << 64) - 1
+
+def _stable_hash(x):
+    """
+    64-bit hash that is identical across processes (unlike hash() on str).
+    
+    Needed so count-min sketches built by different workers can be merged.
+    """
+    if isinstance(x, int):
+        return (x * 0x9E3779B97F4A7C15) & _MASK64
+    data = x.encode('utf-8') if isinstance(x, str) else repr(x).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+class CountMinSketch:
+    """
+    Fixed-size frequency estimator: depth rows of width counters.
+    
+    Each element increments one counter per row; its estimate is the
+    smallest of its counters, which never underestimates and overestimates
+    by at most 2n / width with probability 1 - 2^-depth. Row positions come
+    from one stable 64-bit hash split into two halves (h1 + i * h2).
+    
+    Space Complexity: O(width * depth), independent of the stream
+    """
+
+    def __init__(self, width=1 << 16, depth=4):
+        self.width = width
+        self.depth = depth
+        self.rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+
+    def _cells(self, x):
+        h = _stable_hash(x)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        width = self.width
+        return [(h1 + i * h2) % width for i in range(self.depth)]
+
+    def add(self, x, count=1):
+        """
+        Count x and return its new estimate.
+        """
+        est = None
+        for row, i in zip(self.rows, self._cells(x)):
+            row[i] += count
+            if est is None or row[i] < est:
+                est = row[i]
+        return est
+
+    def estimate(self, x):
+        return min(row[i] for row, i in zip(self.rows, self._cells(x)))
+
+    def merge(self, other):
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("cannot merge sketches of different shape")
+        for row, other_row in zip(self.rows, other.rows):
+            for i, c in enumerate(other_row):
+                if c:
+                    row[i] += c
+        return self
+
+class SpaceSavingTopK:
+    """
+    Streaming approximate top-k with a fixed memory budget (Space-Saving).
+    
+    Tracks at most `capacity` elements. A tracked element is counted exactly
+    from the moment it is tracked; an untracked element evicts the element
+    with the smallest count and inherits that count + 1. Counts therefore
+    never underestimate, and every element with frequency > n / capacity is
+    guaranteed to be tracked.
+    
+    With sketch_width > 0, a CountMinSketch also sees every element and a
+    newcomer starts from its sketch estimate instead (also never an
+    underestimate), which keeps one-off elements from inheriting the large
+    count of the evicted element.
+    
+    The smallest counter is found through a lazy min-heap: heap entries are
+    lower bounds, refreshed only when they reach the top.
+    
+    Time Complexity: O(1) per tracked update, O(log capacity) amortized per eviction
+    Space Complexity: O(capacity + sketch_width * sketch_depth)
+    """
+
+    def __init__(self, capacity=1024, sketch_width=0, sketch_depth=4):
+        self.capacity = capacity
+        self.counts = {}   # element -> overestimated count
+        self.errors = {}   # element -> maximum overestimation
+        self.heap = []     # (count lower bound, tiebreak, element), one entry per element
+        self.tiebreak = itertools.count()  # Keeps elements themselves out of heap comparisons
+        self.n = 0
+        self.sketch = CountMinSketch(sketch_width, sketch_depth) if sketch_width else None
+
+    def _pop_min(self):
+        """
+        Remove and return (count, element) for the smallest tracked count.
+        """
+        counts, heap = self.counts, self.heap
+        while True:
+            c, _, x = heapq.heappop(heap)
+            if counts[x] == c:
+                return c, x
+            heapq.heappush(heap, (counts[x], next(self.tiebreak), x))  # Stale entry, refresh it
+
+    def update(self, x, count=1):
+        """
+        Record `count` more occurrences of x.
+        """
+        self.n += count
+        est = self.sketch.add(x, count) if self.sketch else None
+        counts = self.counts
+        if x in counts:
+            counts[x] += count
+            return
+        if len(counts) < self.capacity:
+            counts[x] = count
+            self.errors[x] = 0
+            heapq.heappush(self.heap, (count, next(self.tiebreak), x))
+            return
+        floor, victim = self._pop_min()
+        del counts[victim], self.errors[victim]
+        new = floor + count if est is None else est
+        counts[x] = new
+        self.errors[x] = new - count
+        heapq.heappush(self.heap, (new, next(self.tiebreak), x))
+
+    def update_many(self, nums):
+        """
+        Record every element of an iterable (consumed once, lazily).
+        """
+        for x in nums:
+            self.update(x)
+
+    def merge(self, other):
+        """
+        Fold another summary (e.g. from another shard) into this one.
+        
+        An element missing from one side may still have occurred there up to
+        that side's smallest count (or its sketch estimate, when it has a
+        sketch), so that amount is added to keep counts overestimates; then
+        only the `capacity` largest counters are kept.
+        
+        Returns:
+            SpaceSavingTopK: self, to allow chaining
+        """
+        def missing(summary):
+            if summary.sketch:
+                return summary.sketch.estimate
+            full = len(summary.counts) >= summary.capacity
+            floor = min(summary.counts.values()) if full and summary.counts else 0
+            return lambda x: floor
+
+        mine, theirs = missing(self), missing(other)
+        counts, errors = {}, {}
+        for x in self.counts.keys() | other.counts.keys():
+            a = self.counts[x] if x in self.counts else mine(x)
+            b = other.counts[x] if x in other.counts else theirs(x)
+            counts[x] = a + b
+            errors[x] = (self.errors[x] if x in self.counts else a) + \
+                        (other.errors[x] if x in other.counts else b)
+        keep = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {x: counts[x] for x in keep}
+        self.errors = {x: errors[x] for x in keep}
+        self.heap = [(c, next(self.tiebreak), x) for x, c in self.counts.items()]
+        heapq.heapify(self.heap)
+        self.n += other.n
+        if self.sketch and other.sketch:
+            self.sketch.merge(other.sketch)
+        return self
+
+    def topk(self, k):
+        """
+        The k elements with the largest estimated counts, most frequent first.
+        """
+        return heapq.nlargest(k, self.counts, key=self.counts.get)
+
+def benchmark(n=10**6, universe=10**5, k=100, capacities=(200, 1000, 5000)):
+    """
+    Recall of SpaceSavingTopK against the exact topKFrequent2.
+    
+    The stream is Zipf-distributed (weight 1/rank) over `universe` values.
+    Recall is the fraction of the exact top-k that the summary returns.
+    
+    Run with: python top_k_frequent_elements.py --bench
+    """
+    import random
+    rng = random.Random(0)
+    nums = rng.choices(range(universe), weights=[1 / (r + 1) for r in range(universe)], k=n)
+    start = time.perf_counter()
+    exact = set(topKFrequent2(nums, k))
+    print(f"{'topKFrequent2':>28}: {time.perf_counter() - start:6.2f}s")
+    for capacity in capacities:
+        for width in (0, 1 << 14):
+            summary = SpaceSavingTopK(capacity, sketch_width=width)
+            start = time.perf_counter()
+            summary.update_many(nums)
+            elapsed = time.perf_counter() - start
+            recall = len(exact.intersection(summary.topk(k))) / k
+            name = f"capacity={capacity}" + (f" +cms({width})" if width else "")
+            print(f"{name:>28}: {elapsed:6.2f}s  recall={recall:.2f}")
+
 def main():
     """
     Main function to demonstrate both top k frequent elements implementations.
@@ -106,6 +311,14 @@ def main():
     
     # Test second implementation (bucket sort)
     print(topKFrequent2(nums, k))
+    
+    # Test streaming approximation (fixed memory)
+    summary = SpaceSavingTopK(capacity=2)
+    summary.update_many(nums)
+    print(summary.topk(k))
 
 if __name__ == '__main__':
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -4,9 +4,17 @@ This module implements a linear-time solution using a hash map (dictionary),
 which stores previously seen numbers and their indices. For each number n,
 we check if target - n has been seen before; if so, we return the pair
 of indices.
+
+For many targets against the same array, TwoSumIndex builds its lookup
+structures once and answers whole batches of targets with NumPy.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; TwoSumIndex falls back to dict lookups
+    np = None
 
 def twosum(nums: List[int], target: int) -> Optional[List[int]]:
     """
@@ -40,9 +48,139 @@ def twosum(nums: List[int], target: int) -> Optional[List[int]]:
     # No solution found
     return None
 
+
+class TwoSumIndex:
+    """
+    Reusable Two Sum index for answering many targets against one array.
+
+    Built once over `nums`:
+    - `positions`: value -> list of indices where it occurs
+    - a sorted NumPy copy of the values plus the original index of each
+
+    query_many() answers a batch of targets by searchsorting the complement
+    of every element for a block of targets at a time, so each target costs
+    one vectorized O(n log n) pass instead of rebuilding a dictionary.
+    Elements appended later go to a small pending list that is checked with
+    dictionary lookups and merged into the sorted copy once it grows past
+    1/8 of the array, so appends never trigger a rebuild on every call.
+
+    Time Complexity: O(n log n) build, O(n log n) per target (vectorized),
+    O(1) amortized per append (plus periodic O(n log n) merges)
+    Space Complexity: O(n)
+    """
+
+    _BLOCK = 1 << 22  # Max targets * elements searched per vectorized step
+
+    def __init__(self, nums: Iterable[int] = ()):
+        # Bulk build: one pass for positions and a single argsort, instead of
+        # append() per element re-sorting every time pending passes 1/8
+        self.nums: List[int] = list(nums)
+        self.positions: Dict[int, List[int]] = {}
+        for i, n in enumerate(self.nums):
+            self.positions.setdefault(n, []).append(i)
+        self.pending: List[int] = list(range(len(self.nums)))  # Indices not yet in the sorted copy
+        self._sorted = self._order = None
+        self._merge_pending()
+
+    def append(self, n: int) -> None:
+        """
+        Add one element at the end of the array (index len(nums)).
+        """
+        i = len(self.nums)
+        self.nums.append(n)
+        self.positions.setdefault(n, []).append(i)
+        self.pending.append(i)
+        if np is not None and len(self.pending) > max(1024, len(self.nums) // 8):
+            self._merge_pending()
+
+    def _merge_pending(self) -> None:
+        if np is None or not self.pending:
+            return
+        values = np.asarray(self.nums, dtype=np.int64)
+        self._order = np.argsort(values, kind='stable')
+        self._sorted = values[self._order]
+        self.pending = []
+
+    def query(self, target: int) -> Optional[List[int]]:
+        """
+        Return indices [i, j] (i < j) with nums[i] + nums[j] == target, or None.
+        """
+        return self.query_many([target])[0]
+
+    def query_many(self, targets: Iterable[int]) -> List[Optional[List[int]]]:
+        """
+        Answer a batch of targets.
+
+        Args:
+            targets: Integer target sums
+
+        Returns:
+            One [i, j] (i < j) or None per target, in input order. When
+            several pairs exist, any one of them may be returned.
+        """
+        targets = list(targets)
+        res: List[Optional[List[int]]] = [None] * len(targets)
+        if np is None:
+            for t, target in enumerate(targets):
+                res[t] = self._query_dict(target, self.positions)
+            return res
+        if self._sorted is not None and len(self._sorted):
+            self._query_sorted(targets, res)
+        # Pairs that involve at least one pending element
+        for t, target in enumerate(targets):
+            if res[t] is None:
+                res[t] = self._query_pending(target)
+        return res
+
+    def _query_sorted(self, targets, res) -> None:
+        """
+        Fill `res` with pairs found among the elements of the sorted copy.
+        """
+        s, order = self._sorted, self._order
+        n = len(s)
+        step = max(1, self._BLOCK // n)
+        own = np.arange(n)
+        for lo in range(0, len(targets), step):
+            block = np.asarray(targets[lo:lo + step], dtype=np.int64)
+            complement = block[:, None] - s[None, :]          # (targets, n)
+            left = np.searchsorted(s, complement, side='left')
+            right = np.searchsorted(s, complement, side='right')
+            # A partner exists if the complement occurs, and occurs somewhere
+            # other than at the element itself
+            itself = (left <= own) & (own < right)
+            ok = (right - left) > itself
+            found = ok.any(axis=1)
+            for row in np.flatnonzero(found):
+                k = int(np.argmax(ok[row]))
+                partner = int(left[row, k]) if left[row, k] != k else k + 1
+                i, j = int(order[k]), int(order[partner])
+                res[lo + row] = [min(i, j), max(i, j)]
+
+    def _query_pending(self, target: int) -> Optional[List[int]]:
+        positions = self.positions
+        for j in self.pending:
+            for i in positions.get(target - self.nums[j], ()):
+                if i != j:
+                    return [min(i, j), max(i, j)]
+        return None
+
+    @staticmethod
+    def _query_dict(target: int, positions: Dict[int, List[int]]) -> Optional[List[int]]:
+        for value, indices in positions.items():
+            partners = positions.get(target - value)
+            if partners is None:
+                continue
+            if partners is not indices:
+                return sorted([indices[0], partners[0]])
+            if len(indices) > 1:
+                return indices[:2]
+        return None
+
 def main():
     # Example usage
     print(twosum([2, 7, 11, 15], 9))
+    index = TwoSumIndex([2, 7, 11, 15])
+    print(index.query_many([9, 26, 4]))  # [[0, 1], [2, 3], None]
 
 if __name__ == "__main__":
     main()
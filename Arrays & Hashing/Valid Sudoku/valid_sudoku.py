@@ -1,3 +1,8 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batch functions need it
+    np = None
+
 def isValidSudoku(board):
     """
     Checks if a 9x9 Sudoku board is valid based on the rules:
@@ -51,6 +56,109 @@ def isValidSudoku(board):
                     
     return True
 
+def isValidSudoku2(board):
+    """
+    Single-pass Sudoku validator using 9-bit masks.
+    
+    Each row, column and 3x3 box keeps an int whose bit d is set once digit d
+    has been seen there. Every filled cell is checked against its three masks
+    in the same pass, so no dictionaries are allocated and the board is read
+    once.
+    
+    Time Complexity: O(1) - 81 cells, one pass.
+    Space Complexity: O(1) - 27 small integers.
+    """
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    for i in range(9):
+        row = board[i]
+        for j in range(9):
+            cell = row[j]
+            if cell == ".":
+                continue
+            bit = 1 << int(cell)
+            b = (i // 3) * 3 + j // 3
+            if (rows[i] | cols[j] | boxes[b]) & bit:
+                return False
+            rows[i] |= bit
+            cols[j] |= bit
+            boxes[b] |= bit
+    return True
+
+def isValidSudokuBatch(boards):
+    """
+    Validates many boards at once with NumPy.
+    
+    `boards` is an (N, 9, 9) uint8 array with 0 for empty cells and 1-9 for
+    digits. Every cell is expanded to a 9-wide one-hot vector, and a board is
+    valid when no row, column or box sums any digit more than once. Values
+    above 9 make a board invalid.
+    
+    Time Complexity: O(N) vectorized
+    Space Complexity: O(N * 729) bytes for the one-hot view
+    
+    Returns:
+        numpy.ndarray: (N,) bool, True where the board is valid
+    """
+    if np is None:
+        raise ImportError("isValidSudokuBatch requires NumPy")
+    boards = np.asarray(boards, dtype=np.uint8).reshape(-1, 9, 9)
+    onehot = (boards[..., None] == np.arange(1, 10, dtype=np.uint8)).view(np.uint8)
+    rows = onehot.sum(axis=2, dtype=np.uint8).max(axis=(1, 2))
+    cols = onehot.sum(axis=1, dtype=np.uint8).max(axis=(1, 2))
+    boxes = onehot.reshape(-1, 3, 3, 3, 3, 9).sum(axis=(2, 4), dtype=np.uint8).max(axis=(1, 2, 3))
+    return (rows <= 1) & (cols <= 1) & (boxes <= 1) & (boards <= 9).all(axis=(1, 2))
+
+# Maps board-file characters to cell values: '1'-'9' -> 1-9, '0' and '.' -> 0
+# (empty), anything else -> 255 (invalid)
+_CELL_TABLE = bytes(c - 48 if 48 <= c <= 57 else 0 if c == 46 else 255 for c in range(256))
+
+def loadBoards(path, batch_size=100_000):
+    """
+    Streams boards from a file with one 81-character board per line.
+    
+    Lines are read lazily and converted in batches with one bytes.translate
+    call, so only batch_size boards are in memory at a time.
+    
+    Yields:
+        numpy.ndarray: (n, 9, 9) uint8 arrays of at most batch_size boards,
+        ready for isValidSudokuBatch
+        
+    Raises:
+        ValueError: If a non-empty line is not 81 characters long
+    """
+    if np is None:
+        raise ImportError("loadBoards requires NumPy")
+    batch = []
+    with open(path, 'rb') as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if len(line) != 81:
+                raise ValueError(f"line {number}: expected 81 characters, got {len(line)}")
+            batch.append(line)
+            if len(batch) == batch_size:
+                yield _toBoards(batch)
+                batch = []
+    if batch:
+        yield _toBoards(batch)
+
+def _toBoards(lines):
+    data = b''.join(lines).translate(_CELL_TABLE)
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, 9, 9)
+
+def validateBoardFile(path, batch_size=100_000):
+    """
+    Validates every board of an 81-char-per-line file.
+    
+    Returns:
+        numpy.ndarray: (N,) bool, one entry per board in file order
+    """
+    results = [isValidSudokuBatch(b) for b in loadBoards(path, batch_size)]
+    return np.concatenate(results) if results else np.zeros(0, dtype=bool)
+
 def main():
     board = [["1","2",".",".","3",".",".",".","."],
              ["4",".",".","5",".",".",".",".","."],
@@ -62,6 +170,10 @@ def main():
              [".",".",".","4","1","9",".",".","8"],
              [".",".",".",".","8",".",".","7","9"]]
     print(isValidSudoku(board))
+    print(isValidSudoku2(board))
+    if np is not None:
+        line = ''.join(''.join(row) for row in board)
+        print(isValidSudokuBatch(_toBoards([line.encode()])))  # Expected: [ True]
 
 if __name__ == '__main__':
     main()
@@ -1,3 +1,10 @@
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; SortedIndex falls back to bisect
+    np = None
+
 def search(nums, target):
     """Performs binary search to find a target value in a sorted list.
     
@@ -26,6 +33,104 @@ def search(nums, target):
             r = mid - 1
     return -1
 
+class SortedIndex:
+    """Static sorted table answering batches of lookups at once.
+    
+    search_many() returns, for every target, the lower bound: the index of
+    the first element >= target, i.e. the same answer as searchInsert (len(table)
+    when every element is smaller). find_many() returns the index of the target
+    or -1, like search().
+    
+    With eytzinger=True the table is additionally stored in Eytzinger (BFS)
+    order: node k has children 2k and 2k + 1, so the first levels of every
+    search share a few cache lines and the descent for a whole batch is one
+    vectorized step per tree level. Otherwise batches go through
+    np.searchsorted, and without NumPy through bisect.
+    
+    Time Complexity: O(n) build (O(n) vectorized for Eytzinger), O(log n) per
+    target, vectorized over the batch
+    Space Complexity: O(n); Eytzinger adds the permuted table and its rank map
+    
+    Args:
+        nums (list): A sorted list (or array) of numbers
+        eytzinger (bool): Also build the Eytzinger layout (requires NumPy)
+    """
+
+    def __init__(self, nums, eytzinger=False):
+        if np is None:
+            if eytzinger:
+                raise ImportError("the Eytzinger layout requires NumPy")
+            self.table = list(nums)
+            self.tree = None
+            return
+        self.table = np.asarray(nums)
+        self.tree = self._build_eytzinger() if eytzinger else None
+
+    def __len__(self):
+        return len(self.table)
+
+    def _build_eytzinger(self):
+        """Return (tree, rank): tree[k] = table[rank[k]] for BFS node k >= 1.
+        
+        The in-order rank of every node is computed level by level:
+        subtree sizes bottom-up, then ranks top-down from the root using
+        rank(left child) = rank(k) - 1 - size(left child's right subtree) and
+        rank(right child) = rank(k) + 1 + size(right child's left subtree).
+        """
+        n = len(self.table)
+        levels = n.bit_length()
+        size = np.zeros(4 * n + 4, dtype=np.int64)  # size[k] = nodes in subtree k (0 past n)
+        for d in range(levels - 1, -1, -1):
+            k = np.arange(1 << d, min(1 << (d + 1), n + 1))
+            size[k] = 1 + size[2 * k] + size[2 * k + 1]
+        rank = np.zeros(2 * n + 2, dtype=np.int64)
+        if n:
+            rank[1] = size[2]
+        for d in range(levels - 1):
+            k = np.arange(1 << d, min(1 << (d + 1), n + 1))
+            left, right = 2 * k, 2 * k + 1
+            rank[left] = rank[k] - 1 - size[2 * left + 1]
+            rank[right] = rank[k] + 1 + size[2 * right]
+        rank = rank[:n + 1]
+        rank[0] = n  # Descents that never go left end at node 0: "past the end"
+        tree = np.empty(n + 1, dtype=self.table.dtype)
+        tree[1:] = self.table[rank[1:]]
+        return tree, rank
+
+    def search_many(self, targets):
+        """Lower-bound index of every target (searchInsert semantics).
+        
+        Returns:
+            numpy.ndarray of indices (a list without NumPy)
+        """
+        if np is None:
+            return [bisect_left(self.table, t) for t in targets]
+        targets = np.asarray(targets)
+        if self.tree is None:
+            return np.searchsorted(self.table, targets, side='left')
+        tree, rank = self.tree
+        n = len(tree) - 1
+        k = np.ones(len(targets), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            active = k <= n
+            go_right = tree[np.where(active, k, 1)] < targets
+            k = np.where(active, 2 * k + go_right, k)
+        # Undo the trailing right turns plus the last left turn:
+        # k >>= (number of trailing 1 bits + 1)
+        trailing = np.log2((k ^ (k + 1)) + 1).astype(np.int64)
+        return rank[k >> trailing]
+
+    def find_many(self, targets):
+        """Index of every target in the table, or -1 where it is absent."""
+        idx = self.search_many(targets)
+        if np is None:
+            return [i if i < len(self.table) and self.table[i] == t else -1
+                    for i, t in zip(idx, targets)]
+        targets = np.asarray(targets)
+        hit = idx < len(self.table)
+        hit[hit] = self.table[idx[hit]] == targets[hit]
+        return np.where(hit, idx, -1)
+
 def main():
     """Main function that demonstrates the binary search algorithm.
     
@@ -37,5 +142,9 @@ def main():
     result = search(nums, target)
     print(f"Target {target} found at index: {result}")
 
+    index = SortedIndex([1, 3, 5, 6], eytzinger=np is not None)
+    print([int(i) for i in index.search_many([5, 2, 7, 0])])  # Expected: [2, 1, 4, 0]
+    print([int(i) for i in index.find_many([5, 2])])          # Expected: [2, -1]
+
 if __name__ == "__main__":
     main()
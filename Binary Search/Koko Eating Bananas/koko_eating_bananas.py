@@ -12,7 +12,18 @@ too slow and we search higher; otherwise we try lower speeds.
 
 Time complexity: O(n log m) where n = len(piles) and m = max(piles).
 Space complexity: O(1).
+
+For large inputs `minEatingSpeedFast` evaluates each candidate speed with a
+single NumPy ceil-division over all piles (pure Python when NumPy is not
+installed), can first collapse duplicate pile sizes into `(size, count)`
+pairs, and `minEatingSpeedMany` answers many `h` budgets in one call.
 """
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the fast path falls back to Python
+    np = None
 
 
 def minEatingSpeed(piles, h):
@@ -55,11 +66,118 @@ def minEatingSpeed(piles, h):
     return l
 
 
+def groupPiles(piles):
+    """Collapse duplicate pile sizes into `(sizes, counts)`.
+
+    Parameters
+    - piles (iterable[int]): bananas in each pile
+
+    Returns
+    - tuple: distinct sizes and how many piles have each size, as int64
+      NumPy arrays when NumPy is available, lists otherwise.
+
+    Every pile of the same size needs the same number of hours, so the
+    search only has to evaluate one ceil-division per distinct size.
+    """
+    if np is not None:
+        return np.unique(np.asarray(piles, dtype=np.int64), return_counts=True)
+    counts = Counter(piles)
+    return list(counts), list(counts.values())
+
+
+def _hoursFunction(piles, grouped):
+    """Return `(hours, top, total)` for the piles, converting them once.
+
+    `hours(speed)` computes the total hours needed at `speed`; `top` is the
+    largest pile and `total` the number of bananas, both taken from the
+    sizes (and counts) built for `hours`.
+    """
+    if grouped:
+        sizes, counts = groupPiles(piles)
+    elif np is not None:
+        sizes, counts = np.asarray(piles, dtype=np.int64), None
+    else:
+        sizes, counts = list(piles), None
+
+    if np is not None:
+        top = int(sizes.max())
+        if counts is None:
+            return lambda speed: int(((sizes + (speed - 1)) // speed).sum()), top, int(sizes.sum())
+        return lambda speed: int(((sizes + (speed - 1)) // speed) @ counts), top, int(sizes @ counts)
+    top = max(sizes)
+    if counts is None:
+        return lambda speed: sum((pile + speed - 1) // speed for pile in sizes), top, sum(sizes)
+    return (lambda speed: sum((size + speed - 1) // speed * count
+                              for size, count in zip(sizes, counts)),
+            top, sum(size * count for size, count in zip(sizes, counts)))
+
+
+def _searchSpeed(hours, h, l, r):
+    """Binary search the smallest speed in [l, r] with hours(speed) <= h."""
+    while l <= r:
+        mid = (l + r) // 2
+        if hours(mid) > h:
+            l = mid + 1
+        else:
+            r = mid - 1
+    return l
+
+
+def minEatingSpeedFast(piles, h, grouped=True):
+    """Return the same result as `minEatingSpeed`, for millions of piles.
+
+    Parameters
+    - piles (list[int] | numpy.ndarray): positive pile sizes
+    - h (int): maximum allowed hours
+    - grouped (bool): collapse duplicate sizes into `(size, count)` pairs
+      first; worth it when pile sizes repeat.
+
+    Returns
+    - int: smallest integer `k` such that all piles are eaten within `h`
+      hours.
+
+    Each probe is one vectorized ceil-division `(sizes + mid - 1) // mid`
+    followed by a sum (a dot product with the counts in grouped mode). The
+    range also starts at ceil(total / h) instead of 1, since no speed below
+    the average can finish in time.
+    """
+    return minEatingSpeedMany(piles, [h], grouped)[0]
+
+
+def minEatingSpeedMany(piles, hs, grouped=True):
+    """Answer `minEatingSpeed(piles, h)` for every budget `h` in `hs`.
+
+    Parameters
+    - piles (list[int] | numpy.ndarray): positive pile sizes
+    - hs (list[int]): hour budgets
+    - grouped (bool): see `minEatingSpeedFast`
+
+    Returns
+    - list[int]: minimum speed for each budget, in the order of `hs`.
+
+    The piles are converted (and grouped) once for all budgets. More hours
+    never require a faster speed, so budgets are solved from largest to
+    smallest and each answer becomes the lower bound of the next search.
+    """
+    hours, top, total = _hoursFunction(piles, grouped)
+
+    speeds = [0] * len(hs)
+    floor = 1
+    for i in sorted(range(len(hs)), key=hs.__getitem__, reverse=True):
+        lo = max(floor, -(-total // hs[i])) if hs[i] > 0 else top + 1
+        floor = speeds[i] = _searchSpeed(hours, hs[i], min(lo, top + 1), top)
+    return speeds
+
+
 def main():
     # example usage and quick sanity check
     piles = [25, 10, 23, 4]
     H = 4
     print(minEatingSpeed(piles, H))
+    print(minEatingSpeedFast(piles, H))
+
+    # many hour budgets over the same piles
+    print(minEatingSpeedMany(piles, [4, 5, 6, 10, 62]))
 
 
 if __name__ == "__main__":
@@ -1,3 +1,12 @@
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+import heapq
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; plain sequences use bisect
+    np = None
+
 def findMedianSortedArrays(nums1, nums2):
     """
     Finds the median of two sorted arrays in O(log(min(m, n))) time.
@@ -81,6 +90,173 @@ def findMedianSortedArrays(nums1, nums2):
         else:
             l = i + 1
 
+def _count(array, value, lo, hi, right):
+    """
+    bisect_left / bisect_right of value in array[lo:hi].
+    
+    NumPy arrays (including np.memmap) use searchsorted on the window so
+    only the pages touched by the search are read.
+    """
+    if np is not None and isinstance(array, np.ndarray):
+        return lo + int(np.searchsorted(array[lo:hi], value, side='right' if right else 'left'))
+    return (bisect_right if right else bisect_left)(array, value, lo, hi)
+
+def kth_of_sorted(arrays, k):
+    """
+    Returns the k-th smallest element (0-based) across k sorted arrays, without merging.
+    
+    Approach: Binary Search on Values
+    ---------------------------------
+    Every array keeps a window [lo, hi) that still may contain the answer,
+    and everything left of the windows is known to be smaller. Each round:
+    1. Take the middle element of the widest window as a pivot value.
+    2. Binary search the pivot in every window to count how many remaining
+       elements are < pivot and <= pivot.
+    3. If k falls among the elements < pivot, shrink every window to the
+       left of them; if it falls among the copies of the pivot, the pivot is
+       the answer; otherwise drop everything <= pivot and subtract it from k.
+    The widest window is cut in half every round, so the loop ends after
+    O(m log n) rounds of m binary searches for m arrays of total size n.
+    
+    Works on lists, array.array, NumPy arrays and np.memmap shards alike.
+    
+    Time Complexity: O(m^2 log^2 n) comparisons, no extra memory
+    Space Complexity: O(m)
+    
+    Raises:
+        IndexError: If k is outside [0, total length)
+    """
+    lo = [0] * len(arrays)
+    hi = [len(a) for a in arrays]
+    if not 0 <= k < sum(hi):
+        raise IndexError("k out of range")
+    while True:
+        widest = max(range(len(arrays)), key=lambda i: hi[i] - lo[i])
+        pivot = arrays[widest][(lo[widest] + hi[widest]) // 2]
+        less = [_count(a, pivot, lo[i], hi[i], False) for i, a in enumerate(arrays)]
+        upto = [_count(a, pivot, lo[i], hi[i], True) for i, a in enumerate(arrays)]
+        nless = sum(l - s for l, s in zip(less, lo))
+        nupto = sum(u - s for u, s in zip(upto, lo))
+        if k < nless:
+            hi = less
+        elif k < nupto:
+            return pivot
+        else:
+            k -= nupto
+            lo = upto
+
+def quantile_of_sorted(arrays, q):
+    """
+    Returns the q-quantile (0 <= q <= 1) of sorted arrays, interpolating
+    linearly between the two closest ranks like numpy.quantile.
+    """
+    total = sum(len(a) for a in arrays)
+    pos = q * (total - 1)
+    below = int(pos)
+    low = kth_of_sorted(arrays, below)
+    if pos == below:
+        return low
+    return low + (kth_of_sorted(arrays, below + 1) - low) * (pos - below)
+
+def median_of_sorted(arrays):
+    """
+    Median of any number of sorted arrays (findMedianSortedArrays for k arrays).
+    """
+    total = sum(len(a) for a in arrays)
+    if total & 1:
+        return kth_of_sorted(arrays, total // 2)
+    return (kth_of_sorted(arrays, total // 2 - 1) + kth_of_sorted(arrays, total // 2)) / 2
+
+class RunningMedian:
+    """
+    Median of a stream, optionally over a sliding window of the last `window` values.
+    
+    Approach: Two Heaps
+    -------------------
+    `low` is a max-heap (stored negated) with the smaller half, `high` a
+    min-heap with the larger half; `low` holds the extra element when the
+    count is odd, so the median is read from the heap tops.
+    
+    With a window, values that fall out are not searched for in the heaps:
+    they are recorded in `delayed` and discarded lazily once they reach a
+    heap top, while `low_size` / `high_size` count only live elements.
+    
+    Time Complexity: O(log n) amortized per push, O(1) per median
+    Space Complexity: O(n), or O(window) plus not-yet-discarded values
+    """
+
+    def __init__(self, window=None):
+        self.window = window
+        self.low, self.high = [], []
+        self.low_size = self.high_size = 0
+        self.delayed = Counter()
+        self.recent = deque()
+
+    def _prune(self, heap, sign):
+        while heap and self.delayed[sign * heap[0]]:
+            value = sign * heapq.heappop(heap)
+            self.delayed[value] -= 1
+
+    def _rebalance(self):
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune(self.high, 1)
+
+    def push(self, value):
+        """
+        Add a value (evicting the oldest one if the window is full).
+        """
+        if not self.low or value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._rebalance()
+        if self.window is not None:
+            self.recent.append(value)
+            if len(self.recent) > self.window:
+                self._evict(self.recent.popleft())
+
+    def _evict(self, value):
+        self.delayed[value] += 1
+        if value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if self.high and value == self.high[0]:
+                self._prune(self.high, 1)
+        self._rebalance()
+
+    def push_many(self, values):
+        """
+        Add every value of an iterable, in order.
+        """
+        for value in values:
+            self.push(value)
+
+    def __len__(self):
+        return self.low_size + self.high_size
+
+    def median(self):
+        """
+        Median of the live values (None when empty).
+        """
+        if not len(self):
+            return None
+        if self.low_size > self.high_size:
+            return -self.low[0]
+        return (-self.low[0] + self.high[0]) / 2
+
 def main():
     """
     Example demonstrating Median of Two Sorted Arrays.
@@ -91,6 +267,11 @@ def main():
     nums1 = [1, 3]
     nums2 = [2]
     print(findMedianSortedArrays(nums1, nums2))
+    print(median_of_sorted([[1, 3], [2], [4, 5, 6]]))  # Expected: 3.5
+    
+    running = RunningMedian(window=3)
+    running.push_many([1, 3, -1, -3, 5])
+    print(running.median())  # Median of [-1, -3, 5]: -1
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,9 @@
+import importlib.util
+import os
+import random
+import sys
+import time
+
 def shipWithinDays(weights, days):
     """
     Determines the minimum ship capacity needed to ship all packages within given days.
@@ -68,6 +74,57 @@ def shipWithinDays(weights, days):
     # At this point, left == right, which is the minimum sufficient capacity
     return right
 
+def _loadPartitionSearch():
+    """
+    Load PartitionSearch from Binary Search/partition_search.py, which holds
+    the single definition shared with split_array.py.
+    """
+    module = sys.modules.get('partition_search')
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'partition_search.py')
+        spec = importlib.util.spec_from_file_location('partition_search', path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['partition_search'] = module
+        spec.loader.exec_module(module)
+    return module.PartitionSearch
+
+PartitionSearch = _loadPartitionSearch()
+
+def shipWithinDays2(weights, days):
+    """
+    shipWithinDays on top of PartitionSearch: O(n + days * log n * log S)
+    instead of O(n log S).
+    """
+    return PartitionSearch(weights).min_capacity(days)
+
+def benchmark(n=10**7, days_list=(10, 1_000, 100_000)):
+    """
+    Compares PartitionSearch against shipWithinDays on n random weights,
+    including one min_capacity_many call answering every budget at once.
+    
+    Run with: python ship_with_in_days.py --bench
+    """
+    rng = random.Random(0)
+    weights = [rng.randrange(1, 100) for _ in range(n)]
+
+    start = time.perf_counter()
+    engine = PartitionSearch(weights)
+    print(f"n = {n:,}: prefix sums built in {time.perf_counter() - start:.2f}s")
+
+    for days in days_list:
+        start = time.perf_counter()
+        fast = engine.min_capacity(days)
+        engineTime = time.perf_counter() - start
+        start = time.perf_counter()
+        slow = shipWithinDays(weights, days)
+        loopTime = time.perf_counter() - start
+        print(f"days = {days:>7,}: engine {engineTime:8.4f}s, "
+              f"shipWithinDays {loopTime:7.2f}s, results match: {fast == slow}")
+
+    start = time.perf_counter()
+    engine.min_capacity_many(list(days_list))
+    print(f"min_capacity_many({list(days_list)}): {time.perf_counter() - start:.4f}s")
+
 def main():
     """
     Main function to demonstrate the ship capacity calculation.
@@ -80,6 +137,14 @@ def main():
     days = 4
     
     print("minimum ship capacity needed:", shipWithinDays(weights, days))
+    print("minimum ship capacity needed:", shipWithinDays2(weights, days))
+    
+    # Several day budgets over the same weights
+    engine = PartitionSearch(weights)
+    print("capacity for 1..6 days:", engine.min_capacity_many([1, 2, 3, 4, 5, 6]))
 
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -1,3 +1,9 @@
+import importlib.util
+import os
+import random
+import sys
+import time
+
 def splitArray(nums, k):
     """
     Solves the 'Split Array Largest Sum' problem using Binary Search.
@@ -36,10 +42,66 @@ def splitArray(nums, k):
     # l stops precisely at the smallest possible maximum sum
     return l
 
+def _loadPartitionSearch():
+    """
+    Load PartitionSearch from Binary Search/partition_search.py, which holds
+    the single definition shared with ship_with_in_days.py.
+    """
+    module = sys.modules.get('partition_search')
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'partition_search.py')
+        spec = importlib.util.spec_from_file_location('partition_search', path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['partition_search'] = module
+        spec.loader.exec_module(module)
+    return module.PartitionSearch
+
+PartitionSearch = _loadPartitionSearch()
+
+def splitArray2(nums, k):
+    """
+    splitArray on top of PartitionSearch: prefix sums are built once and every
+    probe jumps from split to split with bisect, O(k log n) instead of O(n).
+    """
+    return PartitionSearch(nums).min_capacity(k)
+
+def benchmark(n=10**7, ks=(10, 1_000, 100_000)):
+    """
+    Compares PartitionSearch against splitArray on n random weights,
+    including one min_capacity_many call answering every k at once.
+    
+    Run with: python split_array.py --bench
+    """
+    rng = random.Random(0)
+    nums = [rng.randrange(1, 100) for _ in range(n)]
+
+    start = time.perf_counter()
+    engine = PartitionSearch(nums)
+    build = time.perf_counter() - start
+    print(f"n = {n:,}: prefix sums built in {build:.2f}s")
+
+    for k in ks:
+        start = time.perf_counter()
+        fast = engine.min_capacity(k)
+        engineTime = time.perf_counter() - start
+        start = time.perf_counter()
+        split = splitArray(nums, k)
+        splitTime = time.perf_counter() - start
+        print(f"k = {k:>7,}: engine {engineTime:8.4f}s, "
+              f"splitArray {splitTime:7.2f}s, results match: {fast == split}")
+
+    start = time.perf_counter()
+    engine.min_capacity_many(list(ks))
+    print(f"min_capacity_many({list(ks)}): {time.perf_counter() - start:.4f}s")
+
 def main():
     nums = [1,0,2,3,5]
     k = 4
     print(splitArray(nums, k))
+    print(splitArray2(nums, k))
 
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -1,3 +1,15 @@
+from array import array
+import asyncio
+from bisect import bisect_left, bisect_right
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+
 class TimeMap:
     """
     A time-based key-value store that supports retrieving the value of a key 
@@ -43,6 +55,625 @@ class TimeMap:
                 r = mid - 1          # Look for a smaller timestamp in the left half
         return stamp
 
+
+class ConcurrentTimeMap:
+    """
+    TimeMap that can be shared by many threads and an asyncio event loop.
+    
+    Each key maps to a pair of parallel lists (timestamps, values). Writers
+    of the same key are serialized by a per-key lock; writers of different
+    keys never wait for each other. Readers take no lock at all:
+    - in-order sets (the normal case) append the value first and the
+      timestamp second, so a reader that finds a timestamp always finds its
+      value; list.append is atomic under the GIL
+    - an out-of-order set builds new lists with the version inserted
+      (copy-on-write) and publishes them with one atomic dict assignment
+    
+    Every lookup is a single bisect over the key's timestamp list.
+    
+    Time Complexity: O(log n) get, O(1) amortized in-order set, O(n) out-of-order set
+    Space Complexity: O(total versions)
+    """
+
+    def __init__(self):
+        self.storing = {}  # key -> (timestamps, values)
+        self.locks = {}    # key -> writer lock
+
+    def set(self, key: str, value: str, timestamp: int) -> None:
+        """
+        Stores the key with the value at the given timestamp.
+        """
+        lock = self.locks.get(key) or self.locks.setdefault(key, threading.Lock())
+        with lock:
+            self._set_locked(key, value, timestamp)
+
+    def _set_locked(self, key, value, timestamp):
+        entry = self.storing.get(key)
+        if entry is None:
+            self.storing[key] = ([timestamp], [value])
+            return
+        timestamps, values = entry
+        if timestamp > timestamps[-1]:
+            values.append(value)        # Value first: readers index values
+            timestamps.append(timestamp)  # only through a visible timestamp
+            return
+        i = bisect_left(timestamps, timestamp)
+        if timestamps[i] == timestamp:
+            # Copy both lists: readers holding the old pair must not see
+            # later appends to a timestamps list shared with the new pair
+            values = values[:]
+            values[i] = value
+            self.storing[key] = (timestamps[:], values)
+        else:
+            self.storing[key] = (timestamps[:i] + [timestamp] + timestamps[i:],
+                                 values[:i] + [value] + values[i:])
+
+    def get(self, key: str, timestamp: int) -> str:
+        """
+        Returns the value with the largest timestamp_prev <= timestamp, or None.
+        """
+        entry = self.storing.get(key)
+        if entry is None:
+            return None
+        timestamps, values = entry
+        j = bisect_right(timestamps, timestamp) - 1
+        return values[j] if j >= 0 else None
+
+    def get_many(self, keys, timestamp: int) -> list:
+        """
+        get() for many keys at the same timestamp, one bisect per key.
+        """
+        return [self.get(key, timestamp) for key in keys]
+
+    def get_range(self, key: str, t0: int, t1: int) -> list:
+        """
+        All (timestamp, value) versions of key with t0 <= timestamp <= t1.
+        
+        Two bisects find the first and past-the-last version; the answer is
+        one slice of each list.
+        """
+        entry = self.storing.get(key)
+        if entry is None:
+            return []
+        timestamps, values = entry
+        n = len(timestamps)  # Versions appended after this point are ignored
+        i = bisect_left(timestamps, t0, 0, n)
+        j = bisect_right(timestamps, t1, i, n)
+        return list(zip(timestamps[i:j], values[i:j]))
+
+    async def aget(self, key: str, timestamp: int) -> str:
+        """
+        Async get(); reads never block, so this runs inline on the event loop.
+        """
+        return self.get(key, timestamp)
+
+    async def aset(self, key: str, value: str, timestamp: int) -> None:
+        """
+        Async set(). Takes the key's lock without blocking the event loop:
+        if a thread holds it, the write is handed to the default executor.
+        """
+        lock = self.locks.get(key) or self.locks.setdefault(key, threading.Lock())
+        if lock.acquire(blocking=False):
+            try:
+                self._set_locked(key, value, timestamp)
+            finally:
+                lock.release()
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, value, timestamp)
+
+# Segment file layout (little endian, every section 8-byte aligned):
+#   header:         magic b'TMS1', 4 padding bytes, then u64 counts:
+#                   keys K, versions V, distinct values D, key blob bytes,
+#                   value blob bytes
+#   key_offsets:    K + 1 u64, key i is key_blob[key_offsets[i]:key_offsets[i + 1]]
+#   version_starts: K + 1 u64, key i owns versions [starts[i], starts[i + 1])
+#   timestamps:     V i64, ascending within each key
+#   value_ids:      V u64, index into the interned value table
+#   value_offsets:  D + 1 u64
+#   key_blob:       UTF-8 keys in sorted (bytewise) order, padded to 8 bytes
+#   value_blob:     UTF-8 values, each distinct value stored once
+_SEGMENT_HEADER = struct.Struct('<4s4x5Q')
+
+
+_SPILL = 1 << 16  # Buffered entries per section before they go to disk
+
+
+class _SegmentWriter:
+    """
+    Streams a segment to disk one key at a time.
+    
+    Every section is buffered briefly and spilled to its own temporary file,
+    so memory stays bounded by the key being added (plus the value intern
+    table); commit() concatenates the sections behind the header and moves
+    the result into place atomically. Keys must be added in bytewise order.
+    
+    With share_values the intern table spans the whole segment, so a value
+    repeated by many keys is stored once; without it values are only
+    interned within a key, which keeps compaction memory independent of the
+    number of distinct values.
+    """
+
+    _SECTIONS = (('key_offsets', 'Q'), ('version_starts', 'Q'), ('timestamps', 'q'),
+                 ('value_ids', 'Q'), ('value_offsets', 'Q'), ('key_blob', None),
+                 ('value_blob', None))
+
+    def __init__(self, path, share_values=True):
+        self.path = path
+        self.directory = os.path.dirname(os.path.abspath(path))
+        self.share_values = share_values
+        self.files = {name: tempfile.TemporaryFile(dir=self.directory) for name, _ in self._SECTIONS}
+        self.buffers = {name: array(code) if code else bytearray() for name, code in self._SECTIONS}
+        for name in ('key_offsets', 'version_starts', 'value_offsets'):
+            self.buffers[name].append(0)
+        self.keys = self.versions = self.distinct = self.key_bytes = self.value_bytes = 0
+        self.interned = {}
+
+    def _spill(self, force=False):
+        for name, buf in self.buffers.items():
+            if buf and (force or len(buf) >= _SPILL):
+                if isinstance(buf, array) and sys.byteorder == 'big':
+                    buf.byteswap()
+                self.files[name].write(buf.tobytes() if isinstance(buf, array) else buf)
+                del buf[:]
+
+    def add(self, key, versions):
+        """
+        Append one key (str or UTF-8 bytes) with its ascending (timestamp, value) versions.
+        """
+        buffers = self.buffers
+        data = key.encode('utf-8') if isinstance(key, str) else key
+        buffers['key_blob'] += data
+        self.key_bytes += len(data)
+        buffers['key_offsets'].append(self.key_bytes)
+        if not self.share_values:
+            self.interned = {}
+        interned = self.interned
+        for timestamp, value in versions:
+            vid = interned.get(value)
+            if vid is None:
+                vid = interned[value] = self.distinct
+                self.distinct += 1
+                encoded = value.encode('utf-8')
+                buffers['value_blob'] += encoded
+                self.value_bytes += len(encoded)
+                buffers['value_offsets'].append(self.value_bytes)
+            buffers['timestamps'].append(timestamp)
+            buffers['value_ids'].append(vid)
+            self.versions += 1
+        buffers['version_starts'].append(self.versions)
+        self.keys += 1
+        self._spill()
+
+    def commit(self):
+        """
+        Write the header and sections to `path` (fsync + atomic rename).
+        """
+        self._spill(force=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.segment-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_SEGMENT_HEADER.pack(b'TMS1', self.keys, self.versions, self.distinct,
+                                             self.key_bytes, self.value_bytes))
+                for name, _ in self._SECTIONS:
+                    section = self.files[name]
+                    section.seek(0)
+                    shutil.copyfileobj(section, f)
+                    if name == 'key_blob':
+                        f.write(bytes(-self.key_bytes % 8))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        finally:
+            self.close()
+
+    def close(self):
+        for section in self.files.values():
+            section.close()
+
+
+def _write_segment(path, entries):
+    """
+    Atomically write a segment.
+    
+    Args:
+        path (str): Destination file
+        entries (dict): key -> list of (timestamp, value), ascending timestamps
+    """
+    writer = _SegmentWriter(path)
+    for key in sorted(entries, key=lambda k: k.encode('utf-8')):
+        writer.add(key, entries[key])
+    writer.commit()
+
+
+class Segment:
+    """
+    Read-only, memory-mapped segment file.
+    
+    Nothing is parsed on open: lookups binary-search the sorted key
+    directory and then the key's timestamp array straight in the mapping.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, k, v, d, key_bytes, value_bytes = _SEGMENT_HEADER.unpack_from(self.mm, 0)
+        if magic != b'TMS1':
+            self.mm.close()
+            raise ValueError(f"{path} is not a TimeMap segment")
+        self.size = k
+        view = memoryview(self.mm)
+        pos = _SEGMENT_HEADER.size
+
+        def take(count, typecode):
+            nonlocal pos
+            section = view[pos:pos + 8 * count]
+            pos += 8 * count
+            if sys.byteorder == 'big':
+                section = array(typecode, section)
+                section.byteswap()
+                return section
+            return section.cast(typecode)
+
+        self.key_offsets = take(k + 1, 'Q')
+        self.version_starts = take(k + 1, 'Q')
+        self.timestamps = take(v, 'q')
+        self.value_ids = take(v, 'Q')
+        self.value_offsets = take(d + 1, 'Q')
+        self.key_blob = view[pos:pos + key_bytes]
+        pos += key_bytes + (-key_bytes % 8)
+        self.value_blob = view[pos:pos + value_bytes]
+
+    def _key(self, i):
+        return bytes(self.key_blob[self.key_offsets[i]:self.key_offsets[i + 1]])
+
+    def find_key(self, key):
+        """
+        Index of `key` in the key directory, or -1.
+        """
+        target = key.encode('utf-8')
+        l, r = 0, self.size - 1
+        while l <= r:
+            mid = (l + r) // 2
+            probe = self._key(mid)
+            if probe == target:
+                return mid
+            if probe < target:
+                l = mid + 1
+            else:
+                r = mid - 1
+        return -1
+
+    def value(self, vid):
+        return str(self.value_blob[self.value_offsets[vid]:self.value_offsets[vid + 1]], 'utf-8')
+
+    def latest(self, key, timestamp):
+        """
+        (timestamp, value) of the newest version of key at or before timestamp, or None.
+        """
+        i = self.find_key(key)
+        if i < 0:
+            return None
+        lo, hi = self.version_starts[i], self.version_starts[i + 1]
+        j = bisect_right(self.timestamps, timestamp, lo, hi) - 1
+        if j < lo:
+            return None
+        return self.timestamps[j], self.value(self.value_ids[j])
+
+    def max_timestamp(self):
+        """
+        Largest timestamp in the segment (the last version of some key), or None.
+        """
+        starts = self.version_starts
+        return max((self.timestamps[starts[i + 1] - 1] for i in range(self.size)
+                    if starts[i + 1] > starts[i]), default=None)
+
+    def directory(self, tag):
+        """
+        Yield (key bytes, tag, i) for every key, in sorted order.
+        """
+        for i in range(self.size):
+            yield self._key(i), tag, i
+
+    def versions(self, i):
+        """
+        [(timestamp, value), ...] of the i-th key in the directory.
+        """
+        lo, hi = self.version_starts[i], self.version_starts[i + 1]
+        return [(self.timestamps[j], self.value(self.value_ids[j])) for j in range(lo, hi)]
+
+    def items(self):
+        """
+        Yield (key, [(timestamp, value), ...]) for every key.
+        """
+        for i in range(self.size):
+            yield str(self._key(i), 'utf-8'), self.versions(i)
+
+    def close(self):
+        for name in ('key_offsets', 'version_starts', 'timestamps', 'value_ids',
+                     'value_offsets', 'key_blob', 'value_blob'):
+            buf = getattr(self, name)
+            if isinstance(buf, memoryview):
+                buf.release()
+        self.mm.close()
+
+
+# Write-ahead log record: timestamp (i64), key bytes, value bytes (u32 each),
+# then the UTF-8 key and value. A record cut short by a crash is dropped.
+_LOG_RECORD = struct.Struct('<qII')
+
+
+def _replay_log(path, memtable):
+    """
+    Apply every complete record of a write-ahead log to memtable.
+    
+    Returns:
+        tuple: (records applied, newest timestamp or None)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    pos = count = 0
+    latest = None
+    while pos + _LOG_RECORD.size <= len(data):
+        timestamp, key_len, value_len = _LOG_RECORD.unpack_from(data, pos)
+        end = pos + _LOG_RECORD.size + key_len + value_len
+        if end > len(data):
+            break
+        key_end = pos + _LOG_RECORD.size + key_len
+        memtable.set(str(data[pos + _LOG_RECORD.size:key_end], 'utf-8'),
+                     str(data[key_end:end], 'utf-8'), timestamp)
+        count += 1
+        if latest is None or timestamp > latest:
+            latest = timestamp
+        pos = end
+    if pos < len(data):
+        os.truncate(path, pos)  # Drop the torn tail so new records follow a complete one
+    return count, latest
+
+
+class PersistentTimeMap:
+    """
+    TimeMap backed by append-only, memory-mapped segment files.
+    
+    New versions go to an in-memory ConcurrentTimeMap (the memtable), which
+    keeps every key's versions sorted, the last write winning on an equal
+    timestamp, so answers are the same before and after a flush. When it holds
+    flush_threshold versions it is written out as an immutable segment:
+    per-key sorted timestamp arrays (i64) pointing into an interned value
+    table, so a value repeated across versions is stored once. get() checks
+    the memtable and binary-searches every segment through its mmap, keeping
+    the newest version at or before the requested timestamp; reopening the
+    directory after a restart maps the existing segments and replays the
+    write-ahead log.
+    
+    Every set() is first appended to a write-ahead log, so versions still in
+    the memtable survive a crash. A flush freezes the memtable and switches
+    to a fresh log under the lock, then writes the segment outside it (reads
+    keep seeing the frozen memtable meanwhile) and deletes the logs the
+    segment now covers.
+    
+    compact() merges all segments into one and drops versions superseded
+    before the retention horizon; compact_in_background() runs it on a
+    thread while reads and writes continue.
+    
+    Time Complexity: O(log n) per set (amortized flush), O(S * log n) per get
+    for S segments
+    Space Complexity: O(flush_threshold) in memory, the rest on disk
+    """
+
+    def __init__(self, directory, flush_threshold=100_000, retention=None, sync=False):
+        """
+        Args:
+            directory (str): Where segment files live (created if missing)
+            flush_threshold (int): Versions buffered in memory before a flush
+            retention (int): Default compaction keeps every version newer than
+                (latest timestamp - retention); None keeps everything
+            sync (bool): fsync the log on every set(), surviving power loss
+                and not just a process crash
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.flush_threshold = flush_threshold
+        self.retention = retention
+        self.lock = threading.RLock()
+        self.compaction_lock = threading.Lock()  # One compaction at a time
+        self.flush_lock = threading.Lock()       # Segments are published in flush order
+        self.sync = sync
+        self.memtable = ConcurrentTimeMap()
+        self.flushing = []  # Frozen memtables whose segment is being written
+        self.pending = 0
+        names = sorted(n for n in os.listdir(directory)
+                       if n.startswith('segment-') and n.endswith('.tms'))
+        self.segments = [Segment(os.path.join(directory, n)) for n in names]
+        self.next_id = int(names[-1][8:-4]) + 1 if names else 0
+        # Recover the newest timestamp so retention works right after a restart
+        self.latest_timestamp = max((t for t in (seg.max_timestamp() for seg in self.segments)
+                                     if t is not None), default=None)
+        # Versions that never reached a segment are replayed from the logs
+        self.logs = [os.path.join(directory, n) for n in sorted(os.listdir(directory))
+                     if n.startswith('wal-') and n.endswith('.log')]
+        for path in self.logs:
+            count, latest = _replay_log(path, self.memtable)
+            self.pending += count
+            if latest is not None and (self.latest_timestamp is None or latest > self.latest_timestamp):
+                self.latest_timestamp = latest
+        self.next_log = int(self.logs[-1][-12:-4]) + 1 if self.logs else 0
+        self._open_log()
+
+    def _open_log(self):
+        path = os.path.join(self.directory, f"wal-{self.next_log:08d}.log")
+        self.next_log += 1
+        self.log = open(path, 'ab')
+        self.logs.append(path)
+
+    def _segment_path(self):
+        path = os.path.join(self.directory, f"segment-{self.next_id:08d}.tms")
+        self.next_id += 1
+        return path
+
+    def set(self, key: str, value: str, timestamp: int) -> None:
+        """
+        Stores the key with the value at the given timestamp.
+        """
+        key_bytes, value_bytes = key.encode('utf-8'), value.encode('utf-8')
+        record = _LOG_RECORD.pack(timestamp, len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+        with self.lock:
+            self.log.write(record)
+            self.log.flush()
+            if self.sync:
+                os.fsync(self.log.fileno())
+            self.memtable.set(key, value, timestamp)
+            self.pending += 1
+            if self.latest_timestamp is None or timestamp > self.latest_timestamp:
+                self.latest_timestamp = timestamp
+            full = self.pending >= self.flush_threshold
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the memtable out as a new segment and drop the logs it covers.
+        """
+        with self.flush_lock:
+            with self.lock:
+                if not self.pending:
+                    return
+                frozen, covered = self.memtable, self.logs
+                self.log.close()
+                self.logs = []
+                self._open_log()
+                self.memtable = ConcurrentTimeMap()
+                self.pending = 0
+                self.flushing.append(frozen)
+                path = self._segment_path()
+            # The slow part (encoding, fsync) runs without blocking get()/set()
+            _write_segment(path, {k: list(zip(*v)) for k, v in frozen.storing.items()})
+            segment = Segment(path)
+            with self.lock:
+                self.segments.append(segment)
+                self.flushing.remove(frozen)
+            for log in covered:
+                os.unlink(log)
+
+    def get(self, key: str, timestamp: int) -> str:
+        """
+        Returns the value with the largest timestamp_prev <= timestamp, or None.
+        """
+        with self.lock:
+            segments = list(self.segments)
+            tables = [self.memtable] + self.flushing[::-1]
+        # Newest first everywhere; a version must be strictly newer to win
+        best = None
+        for table in tables:
+            timestamps, values = table.storing.get(key, ((), ()))
+            j = bisect_right(timestamps, timestamp) - 1
+            if j >= 0 and (best is None or timestamps[j] > best[0]):
+                best = (timestamps[j], values[j])
+        for segment in reversed(segments):
+            found = segment.latest(key, timestamp)
+            if found is not None and (best is None or found[0] > best[0]):
+                best = found
+        return best[1] if best is not None else None
+
+    def compact(self, horizon=None) -> None:
+        """
+        Merge every segment into one and drop superseded old versions.
+        
+        The segments' sorted key directories are merged as a stream and the
+        output segment is written key by key, so memory is bounded by the
+        versions of the largest key rather than by the whole store.
+        
+        For each key, versions at or after `horizon` are all kept; of the
+        versions before it only the newest survives (it still answers queries
+        at the horizon). When two segments hold the same timestamp for a key
+        the newer segment wins. Queries for timestamps before the horizon are
+        no longer exact afterwards.
+        
+        Args:
+            horizon (int): Retention horizon; defaults to
+                latest timestamp - retention, or no pruning without retention
+        """
+        with self.compaction_lock:
+            self._compact(horizon)
+
+    def _compact(self, horizon):
+        with self.lock:
+            old = list(self.segments)
+            if self.retention is not None and horizon is None and self.latest_timestamp is not None:
+                horizon = self.latest_timestamp - self.retention
+            path = self._segment_path()
+        if len(old) < 2 and horizon is None:
+            return
+        writer = _SegmentWriter(path, share_values=False)
+        try:
+            # Every key directory is sorted bytewise, so a k-way merge visits
+            # each key once, with its entries in segment (oldest first) order
+            directories = [segment.directory(n) for n, segment in enumerate(old)]
+            current, versions = None, {}
+            for key, n, i in heapq.merge(*directories):
+                if key != current:
+                    if current is not None:
+                        writer.add(current, self._retained(versions, horizon))
+                    current, versions = key, {}
+                versions.update(old[n].versions(i))  # Later segments win on equal timestamps
+            if current is not None:
+                writer.add(current, self._retained(versions, horizon))
+        except BaseException:
+            writer.close()
+            raise
+        writer.commit()
+        compacted = Segment(path)
+        with self.lock:
+            # Segments flushed while compacting stay after the compacted one
+            self.segments = [compacted] + [seg for seg in self.segments if seg not in old]
+        for segment in old:
+            os.unlink(segment.path)
+            # Readers may still hold the old segment; its mmap closes once
+            # the last reference is dropped.
+
+    @staticmethod
+    def _retained(versions, horizon):
+        """
+        Ascending (timestamp, value) versions of one key that survive the horizon.
+        """
+        stamps = sorted(versions)
+        if horizon is not None:
+            cut = bisect_left(stamps, horizon)
+            stamps = stamps[max(cut - 1, 0):]
+        return [(t, versions[t]) for t in stamps]
+
+    def compact_in_background(self, horizon=None) -> threading.Thread:
+        """
+        Run compact() on a daemon thread and return the thread.
+        """
+        thread = threading.Thread(target=self.compact, args=(horizon,), daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """
+        Flush pending versions, close the log and unmap every segment.
+        """
+        self.flush()
+        with self.lock:
+            self.log.close()
+            if not self.pending:
+                for log in self.logs:
+                    os.unlink(log)
+                self.logs = []
+            for segment in self.segments:
+                segment.close()
+            self.segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 def main():
     # Example usage
     timestamp = TimeMap()
@@ -0,0 +1,114 @@
+"""
+Shared engine for "minimize the largest part sum" binary searches.
+
+shipWithinDays (Ship With In Days) and splitArray (Split Array) are the same
+problem: cut a sequence of non-negative weights into at most k contiguous
+parts so that the largest part sum is as small as possible. Both scripts
+load PartitionSearch from this file by path with importlib (they are
+standalone scripts, not a package), so there is a single definition to fix
+and tune.
+"""
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+import math
+
+class PartitionSearch:
+    """
+    Reusable engine for "minimize the largest sum when cutting a sequence
+    into at most k contiguous parts" (shipWithinDays, splitArray, ...).
+    
+    Approach: Prefix Sums + Bisect Jumps
+    ------------------------------------
+    The prefix sums are computed once, in an array('q') of n + 1 entries.
+    A feasibility check for a capacity no longer walks every weight: from
+    the start `pos` of the current part, the furthest end that still fits is
+    bisect_right(prefix, prefix[pos] + capacity) - 1, so every part costs a
+    single binary search and a probe stops as soon as it needs more than k
+    parts.
+    
+    Time Complexity: O(n) to build, O(k log n) per probe,
+                     O(k log n log S) per query
+    Space Complexity: O(n) for the prefix sums
+    
+    Args:
+        weights (iterable): Non-negative integers, in order
+    """
+
+    def __init__(self, weights):
+        if not hasattr(weights, '__len__'):
+            weights = list(weights)
+        self.prefix = array('q', accumulate(weights, initial=0))
+        self.n = len(weights)
+        self.total = self.prefix[-1]
+        self.heaviest = max(weights, default=0)
+
+    def parts_needed(self, capacity, limit=None):
+        """
+        Number of parts a greedy cut needs with the given capacity.
+        
+        Args:
+            capacity (int): Largest allowed part sum
+            limit (int): Stop counting once this many parts are exceeded
+            
+        Returns:
+            int: Parts used (limit + 1 if the limit was exceeded), or
+            math.inf if some weight is heavier than capacity
+        """
+        prefix, n = self.prefix, self.n
+        pos = parts = 0
+        while pos < n:
+            end = bisect_right(prefix, prefix[pos] + capacity, pos + 1) - 1
+            if end == pos:  # weights[pos] alone exceeds capacity
+                return math.inf
+            pos = end
+            parts += 1
+            if limit is not None and parts > limit:
+                break
+        return parts
+
+    def fits(self, capacity, parts):
+        """
+        True if the weights can be cut into at most `parts` parts of sum <= capacity.
+        """
+        return self.parts_needed(capacity, parts) <= parts
+
+    def min_capacity(self, parts, hi=None):
+        """
+        Smallest capacity that fits the weights into at most `parts` parts.
+        
+        Args:
+            parts (int): Number of parts (days, k, ...) available
+            hi (int): Known feasible capacity to start the search from
+            
+        Returns:
+            int: Minimum largest part sum (0 for no weights)
+        """
+        # No part can be smaller than the heaviest weight or the average part
+        left = max(self.heaviest, -(-self.total // parts))
+        right = self.total if hi is None else hi
+        while left < right:
+            mid = (left + right) // 2
+            if self.parts_needed(mid, parts) <= parts:
+                right = mid
+            else:
+                left = mid + 1
+        return right
+
+    def min_capacity_many(self, parts_list):
+        """
+        Answers min_capacity for many part counts over the same weights.
+        
+        The answer never grows when more parts are allowed, so the counts are
+        solved in increasing order and each answer becomes the upper bound of
+        the next search.
+        
+        Returns:
+            list: Minimum capacity for each entry of parts_list, in input order
+        """
+        answers = [0] * len(parts_list)
+        hi = self.total
+        for i in sorted(range(len(parts_list)), key=parts_list.__getitem__):
+            hi = answers[i] = self.min_capacity(parts_list[i], hi)
+        return answers
+